@@ -2,17 +2,20 @@
 Модуль моделирования облачного приложения с autoscaling.
 """
 
-from .core import Request, StorageNode, CloudSystemModel
+from .core import Request, RejectReason, StorageNode, CloudSystemModel
 from .load_balancer import LoadBalancer
 from .autoscaler import AutoScaler
 from .metrics import MetricsCollector
+from .batch import batch_simulate
 
 __all__ = [
     'Request',
+    'RejectReason',
     'StorageNode',
     'CloudSystemModel',
     'LoadBalancer',
     'AutoScaler',
     'MetricsCollector',
+    'batch_simulate',
 ]
 
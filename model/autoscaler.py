@@ -7,10 +7,47 @@
 """
 
 import simpy
-from typing import List, Optional, Callable
+import numpy as np
+from typing import List, NamedTuple
 from .core import CloudSystemModel
 
 
+# Числовые значения уровней логирования для фильтрации сообщений
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+
+def _make_deciders(hi: float, lo: float, min_n: int, max_n: int, cooldown: float):
+    """
+    Создает функции пороговых условий масштабирования с зафиксированными
+    параметрами контроллера.
+    
+    Args:
+        hi: Верхний порог
+        lo: Нижний порог
+        min_n: Минимальное количество узлов
+        max_n: Максимальное количество узлов
+        cooldown: Минимальное время между операциями масштабирования
+        
+    Returns:
+        Кортеж функций (decide_up, decide_down) с аргументами
+        (очередь, время отклика, узлов, текущее время, время последнего масштабирования)
+    """
+    def decide_up(q: float, rt: float, active: int, now: float, last: float) -> bool:
+        return (q > hi or rt > hi) and active < max_n and now - last >= cooldown
+    
+    def decide_down(q: float, rt: float, active: int, now: float, last: float) -> bool:
+        return q < lo and rt < lo and active > min_n and now - last >= cooldown
+    
+    return decide_up, decide_down
+
+
+class IntervalMetrics(NamedTuple):
+    """Средние метрики за интервал контроля."""
+    queue_length: float
+    avg_response_time: float
+    active_nodes: int
+
+
 class AutoScaler:
     """
     Контроллер автомасштабирования с пороговой логикой и гистерезисом.
@@ -19,6 +56,17 @@ class AutoScaler:
     и принимает решения о масштабировании количества узлов.
     """
     
+    __slots__ = (
+        'env', 'model', 'min_nodes', 'max_nodes',
+        'low_threshold', 'high_threshold', 'control_interval', 'scale_cooldown',
+        '_decide_up', '_decide_down', 'last_scale_time',
+        'consecutive_low_intervals', 'required_consecutive_low',
+        'history_cap', '_hist_t', '_hist_q', '_hist_rt', '_hist_nodes', '_hist_n',
+        'interval_start_time', '_area', '_last_sample_t', '_last_q',
+        '_interval_rt_sum', '_interval_rt_count',
+        'is_running', 'is_paused', 'log_callback', '_min_level',
+    )
+    
     def __init__(
         self,
         env: simpy.Environment,
@@ -29,7 +77,7 @@ class AutoScaler:
         high_threshold: float = 10.0,
         control_interval: float = 5.0,
         scale_cooldown: float = 10.0,
-        get_metrics_callback: Optional[Callable] = None,
+        history_cap: int = 10_000,
     ):
         """
         Инициализирует контроллер автомасштабирования.
@@ -43,7 +91,7 @@ class AutoScaler:
             high_threshold: Верхний порог для увеличения масштаба (длина очереди)
             control_interval: Интервал между проверками метрик
             scale_cooldown: Минимальное время между операциями масштабирования
-            get_metrics_callback: Функция для получения метрик (опционально)
+            history_cap: Максимальное количество интервалов в истории метрик
         """
         self.env = env
         self.model = model
@@ -53,115 +101,104 @@ class AutoScaler:
         self.high_threshold = high_threshold
         self.control_interval = control_interval
         self.scale_cooldown = scale_cooldown
-        self.get_metrics_callback = get_metrics_callback
+        
+        # Пороговые условия с зафиксированными параметрами контроллера
+        self._decide_up, self._decide_down = _make_deciders(
+            high_threshold, low_threshold, min_nodes, max_nodes, scale_cooldown
+        )
         
         # Состояние контроллера
         self.last_scale_time = 0.0
         self.consecutive_low_intervals = 0  # Счетчик последовательных интервалов с низкой нагрузкой
         self.required_consecutive_low = 2  # Требуемое количество интервалов для уменьшения масштаба
         
-        # История метрик для анализа
-        self.metrics_history: List[dict] = []
+        # История метрик для анализа: кольцевой буфер по столбцам,
+        # хранит последние history_cap интервалов
+        self.history_cap = history_cap
+        self._hist_t = np.empty(history_cap)
+        self._hist_q = np.empty(history_cap)
+        self._hist_rt = np.empty(history_cap)
+        self._hist_nodes = np.empty(history_cap, dtype=np.int32)
+        self._hist_n = 0  # Всего записано интервалов
         
         # Метрики за текущий интервал контроля
         self.interval_start_time = 0.0
-        self.interval_queue_lengths: List[tuple] = []  # (time, queue_length)
-        self.interval_response_times: List[float] = []
+        # Площадь под графиком длины очереди за интервал (для среднего по времени),
+        # обновляется в on_queue_change
+        self._area = 0.0
+        self._last_sample_t = 0.0
+        self._last_q = 0
+        # Сумма и количество времен отклика запросов, завершенных за интервал
+        self._interval_rt_sum = 0.0
+        self._interval_rt_count = 0
         
         # Флаги управления
         self.is_running = False
         self.is_paused = False
         
-        # Callback для логирования
+        # Callback для логирования и минимальный передаваемый уровень
         self.log_callback = None
+        self._min_level = _LEVELS["INFO"]
+        
+        # Получаем времена отклика и изменения очереди от модели по событиям
+        self.model.set_request_finished_callback(self.notify_finished)
+        self.model.set_queue_change_callback(self.on_queue_change)
     
-    def get_current_metrics(self) -> dict:
+    def notify_finished(self, response_time: float):
         """
-        Получает текущие метрики системы.
+        Учитывает время отклика завершенного запроса в метриках текущего интервала.
         
-        Returns:
-            Словарь с метриками (queue_length, avg_response_time и т.д.)
+        Args:
+            response_time: Время отклика завершенного запроса
         """
-        if self.get_metrics_callback:
-            return self.get_metrics_callback()
-        
-        # Базовая реализация: используем длину очереди
-        queue_length = self.model.get_queue_length()
-        
-        # Вычисляем среднее время отклика из обработанных запросов
-        processed = self.model.processed_requests
-        avg_response_time = 0.0
-        if processed:
-            response_times = [r.get_response_time() for r in processed if r.get_response_time() is not None]
-            if response_times:
-                avg_response_time = sum(response_times) / len(response_times)
-        
-        return {
-            'queue_length': queue_length,
-            'avg_response_time': avg_response_time,
-            'active_nodes': len(self.model.get_active_nodes()),
-        }
+        self._interval_rt_sum += response_time
+        self._interval_rt_count += 1
     
-    def should_scale_up(self, metrics: dict) -> bool:
+    @property
+    def metrics_history(self) -> List[dict]:
         """
-        Определяет, нужно ли увеличить количество узлов.
+        История метрик за интервалы контроля.
         
-        Args:
-            metrics: Текущие метрики системы
-            
         Returns:
-            True если нужно увеличить масштаб
+            Список словарей (time, queue_length, avg_response_time, active_nodes)
         """
-        queue_length = metrics.get('queue_length', 0)
-        avg_response_time = metrics.get('avg_response_time', 0)
-        
-        # Увеличиваем масштаб, если очередь или время отклика превышают верхний порог
-        condition = (queue_length > self.high_threshold or 
-                    avg_response_time > self.high_threshold)
-        
-        # Проверяем ограничения
-        current_nodes = len(self.model.get_active_nodes())
-        can_scale = current_nodes < self.max_nodes
-        
-        # Проверяем cooldown
-        time_since_last_scale = self.env.now - self.last_scale_time
-        cooldown_ok = time_since_last_scale >= self.scale_cooldown
-        
-        return condition and can_scale and cooldown_ok
+        n = self._hist_n
+        cap = self.history_cap
+        if n > cap:
+            # Буфер переполнен: самые старые записи начинаются с позиции n % cap
+            order = np.roll(np.arange(cap), -(n % cap))
+        else:
+            order = slice(0, n)
+        return [
+            {
+                'time': t,
+                'queue_length': q,
+                'avg_response_time': rt,
+                'active_nodes': nodes,
+            }
+            for t, q, rt, nodes in zip(
+                self._hist_t[order].tolist(),
+                self._hist_q[order].tolist(),
+                self._hist_rt[order].tolist(),
+                self._hist_nodes[order].tolist(),
+            )
+        ]
     
-    def should_scale_down(self, metrics: dict) -> bool:
+    def _record_history(self, time: float, metrics: IntervalMetrics):
         """
-        Определяет, нужно ли уменьшить количество узлов.
+        Записывает метрики интервала в историю, вытесняя самую старую запись
+        при заполнении буфера.
         
         Args:
-            metrics: Текущие метрики системы
-            
-        Returns:
-            True если нужно уменьшить масштаб
+            time: Время окончания интервала
+            metrics: Метрики за интервал
         """
-        queue_length = metrics.get('queue_length', 0)
-        avg_response_time = metrics.get('avg_response_time', 0)
-        
-        # Уменьшаем масштаб, если показатели стабильно ниже нижнего порога
-        condition = (queue_length < self.low_threshold and 
-                    avg_response_time < self.low_threshold)
-        
-        # Проверяем ограничения
-        current_nodes = len(self.model.get_active_nodes())
-        can_scale = current_nodes > self.min_nodes
-        
-        # Проверяем cooldown
-        time_since_last_scale = self.env.now - self.last_scale_time
-        cooldown_ok = time_since_last_scale >= self.scale_cooldown
-        
-        # Требуем несколько последовательных интервалов с низкой нагрузкой (гистерезис)
-        if condition and can_scale and cooldown_ok:
-            self.consecutive_low_intervals += 1
-            return self.consecutive_low_intervals >= self.required_consecutive_low
-        else:
-            # Сбрасываем счетчик, если условие не выполнено
-            self.consecutive_low_intervals = 0
-            return False
+        i = self._hist_n % self.history_cap
+        self._hist_t[i] = time
+        self._hist_q[i] = metrics.queue_length
+        self._hist_rt[i] = metrics.avg_response_time
+        self._hist_nodes[i] = metrics.active_nodes
+        self._hist_n += 1
     
     def set_log_callback(self, callback):
         """
@@ -172,16 +209,31 @@ class AutoScaler:
         """
         self.log_callback = callback
     
-    def _log(self, message: str, level: str = "INFO"):
+    def set_log_level(self, level: str):
+        """
+        Устанавливает минимальный уровень передаваемых сообщений.
+        
+        Args:
+            level: Уровень логирования (DEBUG, INFO, WARNING, ERROR)
+        """
+        self._min_level = _LEVELS[level]
+    
+    def _log(self, level: str, fmt: str, *args):
         """
         Логирует сообщение через callback.
         
+        Сообщение форматируется только если callback установлен и уровень
+        не ниже минимального.
+        
         Args:
-            message: Текст сообщения
             level: Уровень логирования
+            fmt: Шаблон сообщения в %-формате
+            *args: Аргументы для подстановки в шаблон
         """
-        if self.log_callback:
-            self.log_callback(message, level)
+        cb = self.log_callback
+        if cb is None or self._min_level > _LEVELS[level]:
+            return
+        cb(fmt % args if args else fmt, level)
     
     def scale_up(self) -> bool:
         """
@@ -190,15 +242,15 @@ class AutoScaler:
         Returns:
             True если масштабирование выполнено успешно
         """
-        current_nodes = len(self.model.get_active_nodes())
+        current_nodes = self.model.active_count
         if current_nodes < self.max_nodes:
             self.model.add_node()
             self.last_scale_time = self.env.now
             self.consecutive_low_intervals = 0  # Сбрасываем счетчик при масштабировании
-            new_nodes = len(self.model.get_active_nodes())
+            new_nodes = current_nodes + 1
             self._log(
-                f"МАСШТАБИРОВАНИЕ ВВЕРХ: добавлен узел. Узлов: {current_nodes} → {new_nodes}",
-                "INFO"
+                "INFO", "МАСШТАБИРОВАНИЕ ВВЕРХ: добавлен узел. Узлов: %d → %d",
+                current_nodes, new_nodes
             )
             return True
         return False
@@ -210,37 +262,33 @@ class AutoScaler:
         Returns:
             True если масштабирование выполнено успешно
         """
-        current_nodes = len(self.model.get_active_nodes())
+        current_nodes = self.model.active_count
         if current_nodes > self.min_nodes:
             self.model.remove_node()
             self.last_scale_time = self.env.now
             self.consecutive_low_intervals = 0  # Сбрасываем счетчик после масштабирования
-            new_nodes = len(self.model.get_active_nodes())
+            new_nodes = current_nodes - 1
             self._log(
-                f"МАСШТАБИРОВАНИЕ ВНИЗ: удален узел. Узлов: {current_nodes} → {new_nodes}",
-                "INFO"
+                "INFO", "МАСШТАБИРОВАНИЕ ВНИЗ: удален узел. Узлов: %d → %d",
+                current_nodes, new_nodes
             )
             return True
         return False
     
-    def metrics_collector_loop(self):
+    def on_queue_change(self, queue_length: int):
         """
-        Периодически собирает метрики для расчета средних значений за интервал.
+        Учитывает изменение длины очереди в площади текущего интервала.
+        
+        Длина очереди меняется только при постановке запроса в очередь и
+        извлечении из нее, поэтому площадь считается точно по этим событиям.
+        
+        Args:
+            queue_length: Новая длина очереди
         """
-        while self.is_running:
-            if self.is_paused:
-                yield self.env.timeout(0.1)
-                continue
-            
-            # Собираем метрики каждые 0.1 единицы времени
-            yield self.env.timeout(0.1)
-            
-            if not self.is_running:
-                break
-            
-            # Записываем текущую длину очереди
-            current_queue_length = self.model.get_queue_length()
-            self.interval_queue_lengths.append((self.env.now, current_queue_length))
+        now = self.env.now
+        self._area += self._last_q * (now - self._last_sample_t)
+        self._last_sample_t = now
+        self._last_q = queue_length
     
     def control_loop(self):
         """
@@ -250,9 +298,9 @@ class AutoScaler:
         Считает средние значения метрик за интервал контроля.
         """
         self.interval_start_time = self.env.now
-        
-        # Запускаем сборщик метрик
-        self.env.process(self.metrics_collector_loop())
+        self._area = 0.0
+        self._last_sample_t = self.env.now
+        self._last_q = self.model.get_queue_length()
         
         while self.is_running:
             if self.is_paused:
@@ -267,117 +315,89 @@ class AutoScaler:
             
             # Вычисляем средние метрики за интервал контроля
             interval_end_time = self.env.now
-            metrics = self._calculate_interval_metrics(interval_end_time)
+            active_nodes = self.model.active_count
+            metrics = self._calculate_interval_metrics(interval_end_time, active_nodes)
             
-            self.metrics_history.append({
-                'time': self.env.now,
-                **metrics
-            })
+            self._record_history(interval_end_time, metrics)
             
             # Логируем метрики за интервал
-            queue_len = metrics.get('queue_length', 0)
-            avg_rt = metrics.get('avg_response_time', 0)
-            nodes = metrics.get('active_nodes', 0)
             self._log(
-                f"Интервал контроля (t={self.env.now:.1f}): очередь={queue_len:.1f}, "
-                f"время отклика={avg_rt:.2f}, узлов={nodes}",
-                "INFO"
+                "INFO",
+                "Интервал контроля (t=%.1f): очередь=%.1f, время отклика=%.2f, узлов=%d",
+                interval_end_time, metrics.queue_length,
+                metrics.avg_response_time, active_nodes
             )
             
             # Принимаем решение о масштабировании на основе средних значений
-            if self.should_scale_up(metrics):
+            queue_len, avg_rt, _ = metrics
+            last_scale_time = self.last_scale_time
+            if self._decide_up(queue_len, avg_rt, active_nodes, interval_end_time, last_scale_time):
                 self.scale_up()
-            elif self.should_scale_down(metrics):
-                self.scale_down()
             else:
-                # Логируем, если решение не принято
-                current_nodes = len(self.model.get_active_nodes())
-                if queue_len > self.high_threshold and current_nodes < self.max_nodes:
-                    time_since_scale = self.env.now - self.last_scale_time
+                # Гистерезис: считаем интервалы подряд с низкой нагрузкой,
+                # при невыполнении условия счетчик обнуляется
+                low_load = self._decide_down(
+                    queue_len, avg_rt, active_nodes, interval_end_time, last_scale_time
+                )
+                if low_load:
+                    self.consecutive_low_intervals += 1
+                else:
+                    self.consecutive_low_intervals = 0
+                
+                if low_load and self.consecutive_low_intervals >= self.required_consecutive_low:
+                    self.scale_down()
+                # Логируем, если масштабирование вверх нужно, но заблокировано cooldown
+                elif queue_len > self.high_threshold and active_nodes < self.max_nodes:
+                    time_since_scale = interval_end_time - last_scale_time
                     if time_since_scale < self.scale_cooldown:
                         self._log(
-                            f"Масштабирование заблокировано: cooldown "
-                            f"({time_since_scale:.1f} < {self.scale_cooldown})",
-                            "INFO"
+                            "INFO", "Масштабирование заблокировано: cooldown (%.1f < %s)",
+                            time_since_scale, self.scale_cooldown
                         )
             
             # Сбрасываем метрики для следующего интервала
             self.interval_start_time = self.env.now
-            self.interval_queue_lengths.clear()
-            self.interval_response_times.clear()
+            self._area = 0.0
+            self._last_sample_t = self.env.now
+            self._interval_rt_sum = 0.0
+            self._interval_rt_count = 0
     
-    def _calculate_interval_metrics(self, interval_end_time: float) -> dict:
+    def _calculate_interval_metrics(self, interval_end_time: float, active_nodes: int) -> IntervalMetrics:
         """
         Вычисляет средние метрики за интервал контроля.
         
         Args:
             interval_end_time: Время окончания интервала
+            active_nodes: Количество активных узлов на конец интервала
             
         Returns:
-            Словарь со средними метриками за интервал
+            Средние метрики за интервал
         """
-        # Добавляем финальное значение в историю интервала
-        current_queue_length = self.model.get_queue_length()
-        if not self.interval_queue_lengths or self.interval_queue_lengths[-1][0] < interval_end_time:
-            self.interval_queue_lengths.append((interval_end_time, current_queue_length))
+        # Досчитываем площадь до конца интервала
+        self._area += self._last_q * (interval_end_time - self._last_sample_t)
+        self._last_sample_t = interval_end_time
         
-        # Получаем среднее время отклика за интервал из обработанных запросов
-        # (запросы, обработанные в этом интервале)
-        processed = self.model.processed_requests
-        interval_response_times = [
-            r.get_response_time() 
-            for r in processed 
-            if (r.get_response_time() is not None and 
-                r.finish_time is not None and 
-                r.finish_time >= self.interval_start_time and
-                r.finish_time <= interval_end_time)
-        ]
-        if interval_response_times:
-            self.interval_response_times.extend(interval_response_times)
+        # Средняя длина очереди за интервал (по времени); интервал всегда
+        # включает timeout(control_interval), поэтому его длина положительна
+        avg_queue_length = self._area / (interval_end_time - self.interval_start_time)
         
-        # Вычисляем среднюю длину очереди за интервал (по времени)
-        avg_queue_length = 0.0
-        if len(self.interval_queue_lengths) > 1:
-            total_area = 0.0
-            total_time = 0.0
-            for i in range(len(self.interval_queue_lengths) - 1):
-                t1, q1 = self.interval_queue_lengths[i]
-                t2, q2 = self.interval_queue_lengths[i + 1]
-                dt = t2 - t1
-                if dt > 0:
-                    # Используем среднее значение между двумя точками
-                    avg_q = (q1 + q2) / 2.0
-                    total_area += avg_q * dt
-                    total_time += dt
-            
-            if total_time > 0:
-                avg_queue_length = total_area / total_time
-            else:
-                avg_queue_length = current_queue_length
-        elif self.interval_queue_lengths:
-            avg_queue_length = self.interval_queue_lengths[-1][1]
-        else:
-            avg_queue_length = current_queue_length
-        
-        # Вычисляем среднее время отклика за интервал
+        # Вычисляем среднее время отклика за интервал (накоплено в notify_finished)
         avg_response_time = 0.0
-        if self.interval_response_times:
-            avg_response_time = sum(self.interval_response_times) / len(self.interval_response_times)
-        elif processed:
-            # Fallback: используем общее среднее, если нет данных за интервал
-            response_times = [r.get_response_time() for r in processed if r.get_response_time() is not None]
-            if response_times:
-                avg_response_time = sum(response_times) / len(response_times)
-        
-        return {
-            'queue_length': avg_queue_length,  # Средняя длина очереди за интервал
-            'avg_response_time': avg_response_time,  # Среднее время отклика за интервал
-            'active_nodes': len(self.model.get_active_nodes()),
-        }
+        if self._interval_rt_count:
+            avg_response_time = self._interval_rt_sum / self._interval_rt_count
+        elif self.model.total_rt_count:
+            # Fallback: за интервал ни один запрос не завершился (например, при
+            # насыщении), используем общее среднее, а не 0, чтобы не считать
+            # интервал малонагруженным
+            avg_response_time = self.model.total_rt_sum / self.model.total_rt_count
+        
+        return IntervalMetrics(avg_queue_length, avg_response_time, active_nodes)
     
     def reset(self):
         """Сбрасывает состояние контроллера."""
         self.last_scale_time = 0.0
         self.consecutive_low_intervals = 0
-        self.metrics_history.clear()
+        self._hist_n = 0
+        self._interval_rt_sum = 0.0
+        self._interval_rt_count = 0
 
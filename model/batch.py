@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Пакетный расчет сценариев без SimPy.
+
+Для серии сценариев (разные λ, число узлов, время обработки) рассчитывает
+ту же схему, что и CloudSystemModel: запросы распределяются по узлам
+по кругу (round-robin, как LoadBalancer), и каждый узел обслуживает свою
+очередь FIFO. Расчет ведется векторно по всем сценариям сразу.
+Используется для быстрых предварительных переборов параметров; автомасштабирование,
+ограничение очереди и таймауты ожидания не моделируются.
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+
+def batch_simulate(
+    lambda_rate,
+    n_nodes,
+    service_time_min,
+    service_time_max,
+    net_delay_min=0.0,
+    net_delay_max=0.0,
+    n_requests: int = 10000,
+    seed: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Рассчитывает K сценариев с фиксированным числом узлов.
+    
+    Параметры могут быть скалярами или массивами длины K (приводятся
+    по правилам broadcasting). Запросы поступают пуассоновским потоком,
+    время обработки и сетевая задержка распределены равномерно. Запрос i
+    направляется на узел i % n_nodes и после сетевой задержки встает
+    в очередь этого узла (FIFO).
+    
+    Args:
+        lambda_rate: Интенсивность входящего потока запросов
+        n_nodes: Количество узлов обработки
+        service_time_min: Минимальное время обработки запроса
+        service_time_max: Максимальное время обработки запроса
+        net_delay_min: Минимальная сетевая задержка
+        net_delay_max: Максимальная сетевая задержка
+        n_requests: Количество запросов в каждом сценарии
+        seed: Начальное значение генератора случайных чисел
+    
+    Returns:
+        Словарь массивов длины K: avg_response_time, max_response_time,
+        avg_wait_time, throughput
+    """
+    lam, nodes, s_min, s_max, d_min, d_max = np.broadcast_arrays(
+        np.asarray(lambda_rate, dtype=np.float64),
+        np.asarray(n_nodes, dtype=np.int64),
+        np.asarray(service_time_min, dtype=np.float64),
+        np.asarray(service_time_max, dtype=np.float64),
+        np.asarray(net_delay_min, dtype=np.float64),
+        np.asarray(net_delay_max, dtype=np.float64),
+    )
+    lam, nodes, s_min, s_max, d_min, d_max = (
+        np.atleast_1d(x)[:, None] for x in (lam, nodes, s_min, s_max, d_min, d_max)
+    )
+    if np.any(nodes < 1):
+        raise ValueError("n_nodes должно быть не меньше 1")
+    k = lam.shape[0]
+    n = n_requests
+    
+    rng = np.random.default_rng(seed)
+    arrival = np.cumsum(rng.exponential(1.0, (k, n)) / lam, axis=1)
+    service = s_min + (s_max - s_min) * rng.random((k, n))
+    net_delay = d_min + (d_max - d_min) * rng.random((k, n))
+    ready = arrival + net_delay
+    start = np.empty_like(ready)
+    
+    # Сценарии с одинаковым числом узлов считаются вместе; для каждого узла
+    # берутся его запросы (каждый nodes-й по порядку поступления)
+    for c in np.unique(nodes[:, 0]):
+        rows = np.flatnonzero(nodes[:, 0] == c)
+        for node in range(int(c)):
+            cols = np.arange(node, n, c)
+            start[np.ix_(rows, cols)] = _node_start(
+                ready[np.ix_(rows, cols)], service[np.ix_(rows, cols)]
+            )
+    
+    finish = start + service
+    response = finish - arrival
+    return {
+        'avg_response_time': response.mean(axis=1),
+        'max_response_time': response.max(axis=1),
+        'avg_wait_time': (start - ready).mean(axis=1),
+        'throughput': n / finish.max(axis=1),
+    }
+
+
+def _single_node_start(ready: np.ndarray, service: np.ndarray) -> np.ndarray:
+    """
+    Моменты начала обслуживания для одного узла (рекурсия Линдли в замкнутой форме).
+    
+    finish[i] = S[i] + max_{j<=i}(ready[j] - S[j-1]), где S - накопленная сумма
+    времен обработки; решение вычисляется для всех сценариев сразу.
+    
+    Args:
+        ready: Моменты готовности запросов к обработке, K x N (по возрастанию)
+        service: Времена обработки, K x N
+    
+    Returns:
+        Моменты начала обслуживания, K x N
+    """
+    cum_service = np.cumsum(service, axis=1)
+    prev_cum = cum_service - service
+    finish = cum_service + np.maximum.accumulate(ready - prev_cum, axis=1)
+    return finish - service
+
+
+def _node_start(ready: np.ndarray, service: np.ndarray) -> np.ndarray:
+    """
+    Моменты начала обслуживания запросов, направленных на один узел.
+    
+    Сетевая задержка предшествует постановке в очередь узла, поэтому узел
+    обслуживает запросы в порядке готовности, а не поступления.
+    
+    Args:
+        ready: Моменты готовности запросов к обработке, K x M (в порядке поступления)
+        service: Времена обработки, K x M
+    
+    Returns:
+        Моменты начала обслуживания, K x M (в порядке поступления)
+    """
+    order = np.argsort(ready, axis=1, kind='stable')
+    start_sorted = _single_node_start(
+        np.take_along_axis(ready, order, axis=1),
+        np.take_along_axis(service, order, axis=1),
+    )
+    start = np.empty_like(start_sorted)
+    np.put_along_axis(start, order, start_sorted, axis=1)
+    return start
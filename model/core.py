@@ -8,15 +8,32 @@
 
 import simpy
 import numpy as np
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Optional, List, Dict, Any, Callable
+
+
+# Размер пакета случайных величин, генерируемых за один вызов RNG
+_RNG_BATCH = 4096
+
+# Начальный размер массивов с метриками обработанных запросов
+_PROCESSED_INITIAL_SIZE = 65536
+
+
+class RejectReason(IntEnum):
+    """Причина отказа в обслуживании запроса."""
+    NONE = 0
+    QUEUE_FULL = 1  # Переполнение очереди
+    WAIT_TIMEOUT = 2  # Превышено время ожидания в очереди
+    NO_NODES = 3  # Нет доступных узлов
 
 
-@dataclass
 class Request:
     """
     Представляет входящий запрос пользователя.
     
+    Класс с __slots__ (без __dict__ у экземпляров), так как запросы
+    создаются на каждое поступление.
+    
     Attributes:
         request_id: Уникальный идентификатор запроса
         arrival_time: Время поступления запроса в систему
@@ -24,17 +41,44 @@ class Request:
         finish_time: Время завершения обработки (None если еще не завершена)
         node_id: ID узла, обработавшего запрос (None если еще не назначен)
         rejected: Флаг отказа в обслуживании
+        rejected_reason: Причина отказа (RejectReason.NONE, если отказа не было)
         service_time: Время обработки запроса (генерируется при создании)
+        response_time: Время отклика (заполняется при завершении обработки)
     """
-    request_id: int
-    arrival_time: float
-    queue_entry_time: Optional[float] = None
-    start_time: Optional[float] = None
-    finish_time: Optional[float] = None
-    node_id: Optional[int] = None
-    rejected: bool = False
-    rejected_reason: Optional[str] = None
-    service_time: Optional[float] = None
+    
+    __slots__ = (
+        'request_id', 'arrival_time', 'queue_entry_time', 'start_time',
+        'finish_time', 'node_id', 'rejected', 'rejected_reason',
+        'service_time', 'response_time',
+    )
+    
+    def __init__(
+        self,
+        request_id: int,
+        arrival_time: float,
+        queue_entry_time: Optional[float] = None,
+        start_time: Optional[float] = None,
+        finish_time: Optional[float] = None,
+        node_id: Optional[int] = None,
+        rejected: bool = False,
+        rejected_reason: RejectReason = RejectReason.NONE,
+        service_time: Optional[float] = None,
+        response_time: Optional[float] = None,
+    ):
+        self.request_id = request_id
+        self.arrival_time = arrival_time
+        self.queue_entry_time = queue_entry_time
+        self.start_time = start_time
+        self.finish_time = finish_time
+        self.node_id = node_id
+        self.rejected = rejected
+        self.rejected_reason = rejected_reason
+        self.service_time = service_time
+        self.response_time = response_time
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'Request({fields})'
     
     def get_response_time(self) -> Optional[float]:
         """
@@ -44,9 +88,7 @@ class Request:
             Время отклика в единицах моделируемого времени или None,
             если запрос еще не завершен.
         """
-        if self.finish_time is not None and self.arrival_time is not None:
-            return self.finish_time - self.arrival_time
-        return None
+        return self.response_time
     
     def get_wait_time(self) -> Optional[float]:
         """
@@ -68,7 +110,13 @@ class StorageNode:
     и может обрабатывать несколько запросов одновременно.
     """
     
-    def __init__(self, env: simpy.Environment, node_id: int, capacity: int = 1):
+    def __init__(
+        self,
+        env: simpy.Environment,
+        node_id: int,
+        capacity: int = 1,
+        service_callback: Optional[Callable] = None,
+    ):
         """
         Инициализирует узел обработки.
         
@@ -76,6 +124,8 @@ class StorageNode:
             env: SimPy окружение
             node_id: Уникальный идентификатор узла
             capacity: Количество одновременных запросов, которые может обработать узел
+            service_callback: Функция (node, delta), вызываемая с +1 при начале
+                              обслуживания запроса и с -1 при его завершении
         """
         self.env = env
         self.node_id = node_id
@@ -83,6 +133,8 @@ class StorageNode:
         # SimPy Resource для ограничения параллельной обработки
         self.resource = simpy.Resource(env, capacity=capacity)
         self.is_active = True
+        self.service_callback = service_callback
+        self.in_service = 0  # Количество запросов, обслуживаемых узлом в данный момент
         
     def process_request(self, request: Request, service_time: float) -> simpy.Process:
         """
@@ -101,9 +153,88 @@ class StorageNode:
         # Захватываем ресурс узла
         with self.resource.request() as req:
             yield req
+            self._begin_service()
             # Обработка запроса
             yield self.env.timeout(service_time)
-            request.finish_time = self.env.now
+            self._end_service(request)
+    
+    def _begin_service(self):
+        """Отмечает начало обслуживания запроса."""
+        self.in_service += 1
+        if self.service_callback:
+            self.service_callback(self, 1)
+    
+    def _end_service(self, request: Request):
+        """
+        Отмечает завершение обслуживания запроса.
+        
+        Args:
+            request: Обслуженный запрос
+        """
+        request.finish_time = self.env.now
+        request.response_time = request.finish_time - request.arrival_time
+        self.in_service -= 1
+        if self.service_callback:
+            self.service_callback(self, -1)
+
+
+class _SingleCapacityNode(StorageNode):
+    """
+    Узел с capacity=1 без simpy.Resource.
+    
+    Запросы обслуживаются строго по очереди поступления на узел, поэтому
+    вместо очереди ресурса достаточно хранить момент освобождения узла:
+    запрос начинает обслуживание в max(now, busy_until).
+    """
+    
+    def __init__(
+        self,
+        env: simpy.Environment,
+        node_id: int,
+        service_callback: Optional[Callable] = None,
+    ):
+        """
+        Инициализирует узел обработки.
+        
+        Args:
+            env: SimPy окружение
+            node_id: Уникальный идентификатор узла
+            service_callback: Функция (node, delta), см. StorageNode
+        """
+        self.env = env
+        self.node_id = node_id
+        self.capacity = 1
+        self.is_active = True
+        self.service_callback = service_callback
+        self.in_service = 0
+        # Момент, когда узел освободится от уже назначенных запросов
+        self._busy_until = 0.0
+    
+    def process_request(self, request: Request, service_time: float) -> simpy.Process:
+        """
+        Обрабатывает запрос на узле.
+        
+        Args:
+            request: Запрос для обработки
+            service_time: Время обработки запроса
+            
+        Yields:
+            SimPy событие завершения обработки
+        """
+        env = self.env
+        now = env.now
+        request.node_id = self.node_id
+        request.start_time = now
+        
+        # Резервируем узел сразу, чтобы следующие запросы встали после этого
+        start = max(now, self._busy_until)
+        self._busy_until = start + service_time
+        if start > now:
+            yield env.timeout(start - now)
+        
+        self._begin_service()
+        yield env.timeout(service_time)
+        self._end_service(request)
 
 
 class CloudSystemModel:
@@ -126,6 +257,7 @@ class CloudSystemModel:
         initial_nodes: int = 2,
         node_capacity: int = 1,
         max_wait_time: Optional[float] = None,
+        seed: Optional[int] = None,
     ):
         """
         Инициализирует модель облачного приложения.
@@ -142,6 +274,7 @@ class CloudSystemModel:
             initial_nodes: Начальное количество узлов
             node_capacity: Пропускная способность каждого узла (количество одновременных запросов)
             max_wait_time: Максимальное время ожидания в очереди (None = без ограничений)
+            seed: Начальное значение генератора случайных чисел (None = случайное)
         """
         self.env = env
         self.lambda_rate = lambda_rate
@@ -153,6 +286,17 @@ class CloudSystemModel:
         self.node_capacity = node_capacity
         self.max_wait_time = max_wait_time
         
+        # Генератор случайных чисел и пакеты заранее сгенерированных значений
+        # (буфер, позиция следующего значения); пакеты пополняются по мере расхода
+        # и хранятся как списки float, чтобы не создавать скаляры numpy на каждый запрос
+        self.rng = np.random.default_rng(seed)
+        self._iat_buf: List[float] = []
+        self._iat_i = 0
+        self._svc_buf: List[float] = []
+        self._svc_i = 0
+        self._net_buf: List[float] = []
+        self._net_i = 0
+        
         # Очередь запросов (Store может иметь ограничение размера)
         queue_capacity = None if max_requests_in_flight is None else max_requests_in_flight * 10
         self.queue = simpy.Store(env, capacity=queue_capacity)
@@ -169,23 +313,58 @@ class CloudSystemModel:
         
         # Пул узлов обработки
         self.nodes: List[StorageNode] = []
+        # Список активных узлов, обновляется только в add_node/remove_node
+        self._active_nodes_cache: List[StorageNode] = []
+        self._active_count = 0  # Количество активных узлов (поддерживается add/remove_node)
+        self._in_service = 0  # Количество запросов на обслуживании в активных узлах
         self.next_request_id = 0
         
         # Callback для логирования (инициализируем до вызова add_node)
         self.log_callback = None
+        # Callback, вызываемый при успешном завершении обработки запроса
+        self.request_finished_callback = None
+        # Callback, вызываемый при изменении длины очереди
+        self.queue_change_callback = None
         
         # Инициализация начальных узлов
         for i in range(initial_nodes):
             self.add_node()
         
-        # Метрики
-        self.processed_requests: List[Request] = []
-        self.rejected_requests: List[Request] = []
+        # Метрики обработанных запросов по столбцам (растут удвоением):
+        # время поступления, время завершения, время отклика, узел;
+        # processed_count - заполнено
+        self._proc_arrival = np.empty(_PROCESSED_INITIAL_SIZE)
+        self._proc_finish = np.empty(_PROCESSED_INITIAL_SIZE)
+        self._proc_rt = np.empty(_PROCESSED_INITIAL_SIZE)
+        self._proc_node = np.empty(_PROCESSED_INITIAL_SIZE, dtype=np.int32)
+        self.processed_count = 0
+        # Количество отказов всего и по причинам (индекс - RejectReason)
+        self.rejected_count = 0
+        self.rejected_counts: List[int] = [0] * len(RejectReason)
+        # Сумма и количество времен отклика обработанных запросов (для среднего за O(1))
+        self.total_rt_sum = 0.0
+        self.total_rt_count = 0
         
         # Флаги управления
         self.is_running = False
         self.is_paused = False
+        # Событие, которого ждут процессы модели на паузе (срабатывает в resume)
+        self._resume_event = env.event()
+        
+    def pause(self):
+        """Приостанавливает генерацию и обработку запросов."""
+        self.is_paused = True
+    
+    def resume(self):
+        """
+        Снимает паузу и пробуждает ожидающие процессы модели.
         
+        Должен вызываться из потока, в котором выполняется окружение SimPy.
+        """
+        self.is_paused = False
+        self._resume_event.succeed()
+        self._resume_event = self.env.event()
+    
     def set_log_callback(self, callback):
         """
         Устанавливает callback для логирования.
@@ -195,6 +374,29 @@ class CloudSystemModel:
         """
         self.log_callback = callback
     
+    def set_request_finished_callback(self, callback):
+        """
+        Устанавливает callback, вызываемый при завершении обработки запроса.
+        
+        Args:
+            callback: Функция (response_time) -> None
+        """
+        self.request_finished_callback = callback
+    
+    def set_queue_change_callback(self, callback):
+        """
+        Устанавливает callback, вызываемый при изменении длины очереди.
+        
+        Args:
+            callback: Функция (queue_length) -> None
+        """
+        self.queue_change_callback = callback
+    
+    def _notify_queue_change(self):
+        """Сообщает подписчику текущую длину очереди."""
+        if self.queue_change_callback:
+            self.queue_change_callback(len(self.queue.items))
+    
     def _log(self, message: str, level: str = "INFO"):
         """
         Логирует сообщение через callback.
@@ -214,8 +416,18 @@ class CloudSystemModel:
             Созданный узел
         """
         node_id = len(self.nodes)
-        node = StorageNode(self.env, node_id, capacity=self.node_capacity)
+        if self.node_capacity == 1:
+            node = _SingleCapacityNode(
+                self.env, node_id, service_callback=self._on_service_change
+            )
+        else:
+            node = StorageNode(
+                self.env, node_id, capacity=self.node_capacity,
+                service_callback=self._on_service_change
+            )
         self.nodes.append(node)
+        self._active_nodes_cache.append(node)
+        self._active_count += 1
         self._log(f"Добавлен узел #{node_id}. Всего узлов: {len(self.nodes)}", "INFO")
         return node
     
@@ -229,18 +441,41 @@ class CloudSystemModel:
         if len(self.nodes) > 0:
             node = self.nodes.pop()
             node.is_active = False
+            self._active_nodes_cache.remove(node)
+            self._active_count -= 1
+            # Запросы, обслуживаемые удаленным узлом, больше не учитываются
+            self._in_service -= node.in_service
             self._log(f"Удален узел #{node.node_id}. Всего узлов: {len(self.nodes)}", "INFO")
             return True
         return False
     
+    def _on_service_change(self, node: StorageNode, delta: int):
+        """
+        Учитывает начало (+1) или завершение (-1) обслуживания запроса на узле.
+        
+        Args:
+            node: Узел, на котором изменилось число обслуживаемых запросов
+            delta: Изменение числа обслуживаемых запросов
+        """
+        if node.is_active:
+            self._in_service += delta
+    
     def get_active_nodes(self) -> List[StorageNode]:
         """
         Возвращает список активных узлов.
         
+        Список кэшируется и обновляется при добавлении и удалении узлов,
+        поэтому вызывающий код не должен его изменять.
+        
         Returns:
             Список активных узлов
         """
-        return [node for node in self.nodes if node.is_active]
+        return self._active_nodes_cache
+    
+    @property
+    def active_count(self) -> int:
+        """Количество активных узлов (O(1), без построения списка)."""
+        return self._active_count
     
     def get_queue_length(self) -> int:
         """
@@ -259,7 +494,12 @@ class CloudSystemModel:
             Случайная задержка в диапазоне [net_delay_min, net_delay_max]
         """
         if self.net_delay_max > self.net_delay_min:
-            return np.random.uniform(self.net_delay_min, self.net_delay_max)
+            i = self._net_i
+            if i == len(self._net_buf):
+                self._net_buf = self.rng.uniform(self.net_delay_min, self.net_delay_max, _RNG_BATCH).tolist()
+                i = 0
+            self._net_i = i + 1
+            return self._net_buf[i]
         return self.net_delay_min
     
     def generate_service_time(self) -> float:
@@ -269,7 +509,12 @@ class CloudSystemModel:
         Returns:
             Случайное время обработки в диапазоне [service_time_min, service_time_max]
         """
-        return np.random.uniform(self.service_time_min, self.service_time_max)
+        i = self._svc_i
+        if i == len(self._svc_buf):
+            self._svc_buf = self.rng.uniform(self.service_time_min, self.service_time_max, _RNG_BATCH).tolist()
+            i = 0
+        self._svc_i = i + 1
+        return self._svc_buf[i]
     
     def generate_interarrival_time(self) -> float:
         """
@@ -279,7 +524,12 @@ class CloudSystemModel:
             Случайный межприходный интервал
         """
         if self.lambda_rate > 0:
-            return np.random.exponential(1.0 / self.lambda_rate)
+            i = self._iat_i
+            if i == len(self._iat_buf):
+                self._iat_buf = self.rng.exponential(1.0 / self.lambda_rate, _RNG_BATCH).tolist()
+                i = 0
+            self._iat_i = i + 1
+            return self._iat_buf[i]
         return float('inf')
     
     def request_generator(self):
@@ -289,22 +539,32 @@ class CloudSystemModel:
         Создает запросы с экспоненциальным распределением межприходных интервалов
         и помещает их в очередь.
         """
+        # Без входящего потока запросов генерировать нечего
+        if self.lambda_rate <= 0:
+            return
+        
+        # Локальные ссылки для цикла, выполняемого на каждый запрос
+        env = self.env
+        queue = self.queue
+        max_in_flight = self.max_requests_in_flight
+        
         while self.is_running:
             if self.is_paused:
-                yield self.env.timeout(0.1)
+                yield self._resume_event
                 continue
                 
             # Генерация межприходного интервала
             interarrival = self.generate_interarrival_time()
-            yield self.env.timeout(interarrival)
+            yield env.timeout(interarrival)
             
             if not self.is_running:
                 break
             
             # Создание нового запроса
+            now = env.now
             request = Request(
                 request_id=self.next_request_id,
-                arrival_time=self.env.now
+                arrival_time=now
             )
             self.next_request_id += 1
             
@@ -317,44 +577,37 @@ class CloudSystemModel:
             
             # Проверка ограничения на максимальное количество запросов
             # Если очередь переполнена, отклоняем запрос сразу
-            if self.max_requests_in_flight is not None:
+            if max_in_flight is not None:
                 current_in_system = (
-                    len(self.queue.items) +  # В очереди
-                    sum(len(node.resource.users) for node in self.nodes)  # В обработке
+                    len(queue.items) +  # В очереди
+                    self._in_service  # В обработке
                 )
-                if current_in_system >= self.max_requests_in_flight:
+                if current_in_system >= max_in_flight:
                     # Очередь переполнена - отклоняем запрос
                     request.rejected = True
-                    request.rejected_reason = 'queue_full'
-                    self.rejected_requests.append(request)
-                    if len(self.rejected_requests) % 10 == 0:
+                    request.rejected_reason = RejectReason.QUEUE_FULL
+                    self._reject(request)
+                    if self.rejected_count % 10 == 0:
                         self._log(
                             f"Запрос #{request.request_id} отклонен: переполнение очереди "
-                            f"(в системе: {current_in_system}/{self.max_requests_in_flight})",
+                            f"(в системе: {current_in_system}/{max_in_flight})",
                             "WARNING"
                         )
                     continue
             
-            # Попытка добавить запрос в очередь
-            try:
-                # Если очередь имеет ограничение размера, может быть отказ
-                request.queue_entry_time = self.env.now
-                yield self.queue.put(request)
-            except (simpy.Interrupt, Exception) as e:
-                # Очередь переполнена или другая ошибка
-                request.rejected = True
-                request.rejected_reason = 'queue_full'
-                self.rejected_requests.append(request)
+            # Добавляем запрос в очередь (переполнение проверено выше;
+            # Store при заполнении не выбрасывает исключение, а ждет места)
+            request.queue_entry_time = now
+            yield queue.put(request)
+            self._notify_queue_change()
     
-    def request_processor(self, load_balancer):
+    def start_processors(self, load_balancer):
         """
-        Обрабатывает запросы из очереди.
-        Создает несколько параллельных процессов для обработки запросов.
+        Запускает параллельные процессы обработки запросов из очереди.
         
         Args:
             load_balancer: Балансировщик нагрузки для выбора узла
         """
-        # Создаем несколько параллельных процессов обработки
         # Количество процессов должно быть достаточным для использования всех узлов
         # Используем max_requests_in_flight или разумное значение по умолчанию
         if self.max_requests_in_flight is not None:
@@ -363,13 +616,8 @@ class CloudSystemModel:
             # Без ограничений - создаем достаточно процессов для параллельной обработки
             max_parallel_processors = 100
         
-        # Запускаем несколько параллельных обработчиков
         for _ in range(max_parallel_processors):
             self.env.process(self._single_request_processor(load_balancer))
-        
-        # Генератор должен что-то yield'ить, чтобы быть валидным
-        while self.is_running:
-            yield self.env.timeout(1.0)  # Просто ждем, процессы уже запущены
     
     def _single_request_processor(self, load_balancer):
         """
@@ -378,34 +626,40 @@ class CloudSystemModel:
         Args:
             load_balancer: Балансировщик нагрузки для выбора узла
         """
+        # Локальные ссылки для цикла, выполняемого на каждый запрос
+        env = self.env
+        queue = self.queue
+        max_wait_time = self.max_wait_time
+        
         while self.is_running:
             if self.is_paused:
-                yield self.env.timeout(0.1)
+                yield self._resume_event
                 continue
             
             try:
                 # Получаем запрос из очереди
-                request = yield self.queue.get()
+                request = yield queue.get()
+                self._notify_queue_change()
                 
                 # Проверяем максимальное время ожидания в очереди
-                if self.max_wait_time is not None and request.queue_entry_time is not None:
-                    wait_time = self.env.now - request.queue_entry_time
-                    if wait_time > self.max_wait_time:
+                if max_wait_time is not None and request.queue_entry_time is not None:
+                    wait_time = env.now - request.queue_entry_time
+                    if wait_time > max_wait_time:
                         # Превышено время ожидания - отклоняем запрос
                         request.rejected = True
-                        request.rejected_reason = 'wait_timeout'
-                        self.rejected_requests.append(request)
-                        if len([r for r in self.rejected_requests if r.rejected_reason == 'wait_timeout']) % 10 == 0:
+                        request.rejected_reason = RejectReason.WAIT_TIMEOUT
+                        self._reject(request)
+                        if self.rejected_counts[RejectReason.WAIT_TIMEOUT] % 10 == 0:
                             self._log(
                                 f"Запрос #{request.request_id} отклонен: превышено время ожидания "
-                                f"({wait_time:.2f} > {self.max_wait_time})",
+                                f"({wait_time:.2f} > {max_wait_time})",
                                 "WARNING"
                             )
                         continue
                 
-                # Обрабатываем запрос
+                # Обрабатываем запрос в этом же процессе (без отдельного Process на запрос)
                 # Ограничение параллелизма обеспечивается capacity каждого узла
-                yield self.env.process(self._process_request(request, load_balancer))
+                yield from self._process_request(request, load_balancer)
                     
             except simpy.Interrupt:
                 break
@@ -424,8 +678,8 @@ class CloudSystemModel:
         if node is None:
             # Нет доступных узлов - отказ
             request.rejected = True
-            request.rejected_reason = 'no_nodes'
-            self.rejected_requests.append(request)
+            request.rejected_reason = RejectReason.NO_NODES
+            self._reject(request)
             return
         
         # Добавляем сетевую задержку
@@ -436,18 +690,68 @@ class CloudSystemModel:
         yield from node.process_request(request, request.service_time)
         
         # Запрос успешно обработан
-        self.processed_requests.append(request)
+        self._record_processed(request)
+        response_time = request.response_time
+        self.total_rt_sum += response_time
+        self.total_rt_count += 1
+        if self.request_finished_callback:
+            self.request_finished_callback(response_time)
         
         # Логируем каждые 50 обработанных запросов
-        if len(self.processed_requests) % 50 == 0:
-            response_time = request.get_response_time()
+        if self.processed_count % 50 == 0:
             self._log(
-                f"Обработано запросов: {len(self.processed_requests)}. "
+                f"Обработано запросов: {self.processed_count}. "
                 f"Последний: запрос #{request.request_id} на узле #{node.node_id}, "
                 f"время отклика: {response_time:.2f}",
                 "INFO"
             )
     
+    def _record_processed(self, request: Request):
+        """
+        Записывает обработанный запрос в массивы метрик.
+        
+        Args:
+            request: Успешно обработанный запрос
+        """
+        n = self.processed_count
+        if n == len(self._proc_arrival):
+            size = 2 * n
+            self._proc_arrival = np.resize(self._proc_arrival, size)
+            self._proc_finish = np.resize(self._proc_finish, size)
+            self._proc_rt = np.resize(self._proc_rt, size)
+            self._proc_node = np.resize(self._proc_node, size)
+        self._proc_arrival[n] = request.arrival_time
+        self._proc_finish[n] = request.finish_time
+        self._proc_rt[n] = request.response_time
+        self._proc_node[n] = request.node_id
+        self.processed_count = n + 1
+    
+    def _reject(self, request: Request):
+        """
+        Учитывает отказ в обслуживании (причина берется из request.rejected_reason).
+        
+        Args:
+            request: Отклоненный запрос
+        """
+        self.rejected_count += 1
+        self.rejected_counts[request.rejected_reason] += 1
+    
+    def get_response_times(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Возвращает времена отклика обработанных запросов.
+        
+        Args:
+            start: Индекс первого запроса (в порядке завершения)
+            stop: Индекс после последнего запроса (None = до конца)
+            
+        Returns:
+            Представление (view) массива времен отклика запросов [start, stop),
+            без копирования; вызывающий код не должен его изменять
+        """
+        if stop is None:
+            stop = self.processed_count
+        return self._proc_rt[start:stop]
+    
     def get_system_state(self) -> Dict[str, Any]:
         """
         Возвращает текущее состояние системы.
@@ -458,9 +762,9 @@ class CloudSystemModel:
         return {
             'sim_time': self.env.now,
             'queue_length': self.get_queue_length(),
-            'active_nodes': len(self.get_active_nodes()),
+            'active_nodes': self.active_count,
             'total_nodes': len(self.nodes),
-            'processed_count': len(self.processed_requests),
-            'rejected_count': len(self.rejected_requests),
+            'processed_count': self.processed_count,
+            'rejected_count': self.rejected_count,
         }
 
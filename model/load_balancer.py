@@ -25,7 +25,7 @@ class LoadBalancer:
         Выбирает узел для обработки запроса по алгоритму round-robin.
         
         Args:
-            nodes: Список доступных узлов
+            nodes: Список активных узлов (см. CloudSystemModel.get_active_nodes)
             
         Returns:
             Выбранный узел или None, если узлов нет
@@ -33,16 +33,13 @@ class LoadBalancer:
         if not nodes:
             return None
         
-        # Фильтруем только активные узлы
-        active_nodes = [node for node in nodes if node.is_active]
-        if not active_nodes:
-            return None
-        
         # Round-robin: выбираем следующий узел по кругу
-        selected = active_nodes[self.current_index % len(active_nodes)]
-        self.current_index = (self.current_index + 1) % len(active_nodes)
-        
-        return selected
+        # (индекс сбрасывается, если вышел за пределы списка, например после удаления узла)
+        i = self.current_index
+        if i >= len(nodes):
+            i = 0
+        self.current_index = i + 1
+        return nodes[i]
     
     def reset(self):
         """Сбрасывает состояние балансировщика."""
@@ -6,9 +6,9 @@
 работы системы и отображения в GUI.
 """
 
-from typing import List, Dict, Any, Optional
-from collections import deque
-from .core import Request, CloudSystemModel
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple
+from .core import CloudSystemModel, RejectReason
 
 
 class MetricsCollector:
@@ -28,16 +28,28 @@ class MetricsCollector:
         """
         self.max_history_size = max_history_size
         
-        # Временные ряды
-        self.time_series: List[float] = deque(maxlen=max_history_size)
-        self.queue_length_series: List[int] = deque(maxlen=max_history_size)
-        self.nodes_count_series: List[int] = deque(maxlen=max_history_size)
-        self.avg_response_time_series: List[float] = deque(maxlen=max_history_size)
+        # Временные ряды: кольцевой буфер, строки - время, длина очереди,
+        # количество узлов, среднее время отклика; _head - позиция следующей записи
+        self._ring = np.empty((4, max_history_size))
+        self._head = 0
+        self._size = 0
+        self.snapshot_count = 0  # Всего записано снимков (включая вытесненные)
         
         # Агрегированные метрики
         self.total_requests = 0
-        self.processed_requests: List[Request] = []
-        self.rejected_requests: List[Request] = []
+        self.processed_count = 0
+        self.rejected_count = 0
+        self.rejected_counts: List[int] = [0] * len(RejectReason)  # Отказы по причинам
+        self.model: Optional[CloudSystemModel] = None  # Модель последнего обновления
+        
+        # Накопленные характеристики времени отклика обработанных запросов;
+        # _rt_cursor - сколько обработанных запросов модели уже учтено
+        self._rt_cursor = 0
+        self._rt_sum = 0.0
+        self._rt_count = 0
+        self._rt_max = float('-inf')
+        self._rt_min = float('inf')
+        self._rt_sla_hits = 0
         
         # SLA параметры
         self.sla_threshold: Optional[float] = None  # Порог времени отклика для SLA
@@ -50,6 +62,10 @@ class MetricsCollector:
             threshold: Максимальное время отклика для соответствия SLA
         """
         self.sla_threshold = threshold
+        # Пересчитываем попадания в SLA по уже учтенным запросам
+        if self.model is not None:
+            response_times = self.model.get_response_times(0, self._rt_cursor)
+            self._rt_sla_hits = int(np.count_nonzero(response_times <= threshold))
     
     def record_snapshot(
         self,
@@ -67,22 +83,50 @@ class MetricsCollector:
             nodes_count: Количество активных узлов
             avg_response_time: Среднее время отклика за период
         """
-        self.time_series.append(sim_time)
-        self.queue_length_series.append(queue_length)
-        self.nodes_count_series.append(nodes_count)
-        self.avg_response_time_series.append(avg_response_time)
+        head = self._head
+        self._ring[:, head] = (sim_time, queue_length, nodes_count, avg_response_time)
+        self._head = (head + 1) % self.max_history_size
+        if self._size < self.max_history_size:
+            self._size += 1
+        self.snapshot_count += 1
+    
+    def _ordered_series(self) -> np.ndarray:
+        """
+        Возвращает временные ряды в хронологическом порядке.
+        
+        Returns:
+            Массив 4 x N (время, длина очереди, количество узлов, время отклика)
+        """
+        if self._size < self.max_history_size:
+            return self._ring[:, :self._size]
+        return np.roll(self._ring, -self._head, axis=1)
     
-    def update_requests(self, processed: List[Request], rejected: List[Request]):
+    def update_requests(self, model: CloudSystemModel):
         """
-        Обновляет информацию о запросах.
+        Обновляет информацию о запросах по счетчикам модели.
+        
+        Времена отклика учитываются инкрементально: обрабатываются только
+        запросы, завершенные с прошлого обновления.
         
         Args:
-            processed: Список обработанных запросов
-            rejected: Список отклоненных запросов
+            model: Модель облачного приложения
         """
-        self.processed_requests = processed.copy()
-        self.rejected_requests = rejected.copy()
-        self.total_requests = len(processed) + len(rejected)
+        self.model = model
+        self.processed_count = model.processed_count
+        self.rejected_count = model.rejected_count
+        self.rejected_counts = list(model.rejected_counts)
+        self.total_requests = self.processed_count + self.rejected_count
+        
+        # Учитываем только запросы, завершенные с прошлого обновления
+        response_times = model.get_response_times(self._rt_cursor)
+        if response_times.size:
+            self._rt_sum += float(response_times.sum())
+            self._rt_count += response_times.size
+            self._rt_max = max(self._rt_max, float(response_times.max()))
+            self._rt_min = min(self._rt_min, float(response_times.min()))
+            if self.sla_threshold is not None:
+                self._rt_sla_hits += int(np.count_nonzero(response_times <= self.sla_threshold))
+        self._rt_cursor = self.processed_count
     
     def get_time_series(self) -> Dict[str, List]:
         """
@@ -91,13 +135,40 @@ class MetricsCollector:
         Returns:
             Словарь с временными рядами
         """
+        time, queue_length, nodes_count, avg_response_time = self._ordered_series().tolist()
         return {
-            'time': list(self.time_series),
-            'queue_length': list(self.queue_length_series),
-            'nodes_count': list(self.nodes_count_series),
-            'avg_response_time': list(self.avg_response_time_series),
+            'time': time,
+            'queue_length': queue_length,
+            'nodes_count': nodes_count,
+            'avg_response_time': avg_response_time,
         }
     
+    def get_time_series_since(
+        self, start: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Возвращает снимки, записанные после первых start снимков.
+        
+        Позволяет передавать в GUI только новые точки вместо всех рядов.
+        Если часть этих снимков уже вытеснена из буфера, возвращаются оставшиеся.
+        Массивы копируются из буфера и могут передаваться в другой поток.
+        
+        Args:
+            start: Количество снимков, полученных ранее (см. snapshot_count)
+            
+        Returns:
+            Кортеж массивов новых точек: время, длина очереди,
+            количество узлов, среднее время отклика
+        """
+        n = max(min(self.snapshot_count - start, self._size), 0)
+        first = self._head - n
+        if first >= 0:
+            block = self._ring[:, first:self._head].copy()
+        else:
+            block = np.concatenate((self._ring[:, first:], self._ring[:, :self._head]), axis=1)
+        time, queue_length, nodes_count, avg_response_time = block
+        return time, queue_length, nodes_count, avg_response_time
+    
     def get_aggregated_metrics(self) -> Dict[str, Any]:
         """
         Вычисляет и возвращает агрегированные метрики.
@@ -105,17 +176,15 @@ class MetricsCollector:
         Returns:
             Словарь с агрегированными метриками
         """
-        # Подсчитываем отказы по причинам
-        rejected_queue_full = sum(1 for r in self.rejected_requests 
-                                  if r.rejected_reason == 'queue_full')
-        rejected_wait_timeout = sum(1 for r in self.rejected_requests 
-                                    if r.rejected_reason == 'wait_timeout')
-        rejected_other = len(self.rejected_requests) - rejected_queue_full - rejected_wait_timeout
+        # Отказы по причинам
+        rejected_queue_full = self.rejected_counts[RejectReason.QUEUE_FULL]
+        rejected_wait_timeout = self.rejected_counts[RejectReason.WAIT_TIMEOUT]
+        rejected_other = self.rejected_count - rejected_queue_full - rejected_wait_timeout
         
         metrics = {
             'total_requests': self.total_requests,
-            'processed_requests': len(self.processed_requests),
-            'rejected_requests': len(self.rejected_requests),
+            'processed_requests': self.processed_count,
+            'rejected_requests': self.rejected_count,
             'rejected_queue_full': rejected_queue_full,
             'rejected_wait_timeout': rejected_wait_timeout,
             'rejected_other': rejected_other,
@@ -128,49 +197,36 @@ class MetricsCollector:
             'sla_compliance_rate': 0.0,
         }
         
-        # Вычисляем метрики по обработанным запросам
-        if self.processed_requests:
-            response_times = [
-                r.get_response_time() 
-                for r in self.processed_requests 
-                if r.get_response_time() is not None
-            ]
+        # Метрики по обработанным запросам (накоплены в update_requests)
+        if self._rt_count:
+            metrics['avg_response_time'] = self._rt_sum / self._rt_count
+            metrics['max_response_time'] = self._rt_max
+            metrics['min_response_time'] = self._rt_min
             
-            if response_times:
-                metrics['avg_response_time'] = sum(response_times) / len(response_times)
-                metrics['max_response_time'] = max(response_times)
-                metrics['min_response_time'] = min(response_times)
-                
-                # Вычисляем долю запросов, соответствующих SLA
-                if self.sla_threshold is not None:
-                    sla_compliant = sum(1 for rt in response_times if rt <= self.sla_threshold)
-                    metrics['sla_compliance_rate'] = sla_compliant / len(response_times) * 100.0
+            # Доля запросов, соответствующих SLA
+            if self.sla_threshold is not None:
+                metrics['sla_compliance_rate'] = self._rt_sla_hits / self._rt_count * 100.0
         
         # Вычисляем метрики по очереди (средняя по времени, а не по снимкам)
-        if len(self.time_series) > 1 and len(self.queue_length_series) > 1:
-            # Вычисляем среднюю длину очереди по времени (интеграл)
-            total_area = 0.0
-            total_time = 0.0
-            for i in range(len(self.time_series) - 1):
-                dt = self.time_series[i + 1] - self.time_series[i]
-                queue_len = self.queue_length_series[i]
-                total_area += queue_len * dt
-                total_time += dt
+        if self._size:
+            times, queue_lengths = self._ordered_series()[:2]
+            metrics['max_queue_length'] = int(queue_lengths.max())
             
-            if total_time > 0:
-                metrics['avg_queue_length'] = total_area / total_time
+            if self._size > 1:
+                # Средняя длина очереди по времени (интеграл ступенчатой функции)
+                dt = np.diff(times)
+                total_time = dt.sum()
+                if total_time > 0:
+                    metrics['avg_queue_length'] = float(queue_lengths[:-1] @ dt / total_time)
+                else:
+                    metrics['avg_queue_length'] = float(queue_lengths[-1])
             else:
-                metrics['avg_queue_length'] = self.queue_length_series[-1] if self.queue_length_series else 0.0
-            
-            metrics['max_queue_length'] = max(self.queue_length_series)
-        elif self.queue_length_series:
-            # Fallback: если недостаточно данных, используем простое среднее
-            metrics['avg_queue_length'] = sum(self.queue_length_series) / len(self.queue_length_series)
-            metrics['max_queue_length'] = max(self.queue_length_series)
+                # Fallback: если недостаточно данных, используем простое среднее
+                metrics['avg_queue_length'] = float(queue_lengths.mean())
         
         # Вычисляем долю отказов
         if self.total_requests > 0:
-            metrics['rejection_rate'] = len(self.rejected_requests) / self.total_requests * 100.0
+            metrics['rejection_rate'] = self.rejected_count / self.total_requests * 100.0
         
         return metrics
     
@@ -184,33 +240,34 @@ class MetricsCollector:
         Returns:
             Словарь с текущими метриками
         """
-        # Вычисляем среднее время отклика
-        processed = model.processed_requests
+        # Среднее время отклика по накопленным в модели суммам
         avg_response_time = 0.0
-        if processed:
-            response_times = [
-                r.get_response_time() 
-                for r in processed 
-                if r.get_response_time() is not None
-            ]
-            if response_times:
-                avg_response_time = sum(response_times) / len(response_times)
+        if model.total_rt_count:
+            avg_response_time = model.total_rt_sum / model.total_rt_count
         
         return {
             'sim_time': model.env.now,
             'queue_length': model.get_queue_length(),
-            'active_nodes': len(model.get_active_nodes()),
+            'active_nodes': model.active_count,
             'avg_response_time': avg_response_time,
         }
     
     def reset(self):
         """Сбрасывает все собранные метрики."""
-        self.time_series.clear()
-        self.queue_length_series.clear()
-        self.nodes_count_series.clear()
-        self.avg_response_time_series.clear()
+        self._head = 0
+        self._size = 0
+        self.snapshot_count = 0
         
         self.total_requests = 0
-        self.processed_requests.clear()
-        self.rejected_requests.clear()
+        self.processed_count = 0
+        self.rejected_count = 0
+        self.rejected_counts = [0] * len(RejectReason)
+        self.model = None
+        
+        self._rt_cursor = 0
+        self._rt_sum = 0.0
+        self._rt_count = 0
+        self._rt_max = float('-inf')
+        self._rt_min = float('inf')
+        self._rt_sla_hits = 0
 
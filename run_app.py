@@ -8,105 +8,97 @@
 # Устанавливаем кодировку ДО всех импортов
 import os
 import sys
-import io
 
 # Критически важно установить это до импорта любых модулей
+# (действует на дочерние процессы; сам интерпретатор в режиме UTF-8
+# запускается через `python -X utf8 run_app.py` или PYTHONUTF8=1, см. README)
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 os.environ['PYTHONUTF8'] = '1'
 
-# Переопределяем open() для использования UTF-8 по умолчанию
-# Это нужно для SimPy, который читает исходные файлы
-try:
-    import builtins
-    _original_open = builtins.open
-    
-    def _utf8_open(file, mode='r', buffering=-1, encoding=None, errors=None, 
-                   newline=None, closefd=True, opener=None):
-        """Версия open() с UTF-8 по умолчанию."""
-        if 'b' not in mode and encoding is None:
-            encoding = 'utf-8'
-        if errors is None and 'b' not in mode:
-            errors = 'replace'
-        return _original_open(file, mode, buffering, encoding, errors, newline, closefd, opener)
-    
-    builtins.open = _utf8_open
-except Exception:
-    pass  # Если не удалось, продолжаем без этого
-
 import traceback
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QApplication, QMessageBox
 from ui.main_window import MainWindow
 from utils.icon_creator import create_cloud_icon
+from utils.opengl import opengl_available
+
+
+def _reconfigure_utf8(stream):
+    """
+    Переключает поток вывода на кодировку UTF-8.
+    
+    Под pythonw потоки вывода отсутствуют (None) и пропускаются.
+    
+    Args:
+        stream: Текстовый поток (sys.stdout или sys.stderr) или None
+    """
+    if stream is None:
+        return
+    stream.reconfigure(encoding='utf-8', errors='replace', line_buffering=True)
 
 
 def setup_console():
     """Настраивает консоль для вывода ошибок на Windows."""
     if sys.platform == 'win32':
         try:
-            # Пытаемся открыть консоль для вывода
             import ctypes
             kernel32 = ctypes.windll.kernel32
-            # Выделяем консоль
-            kernel32.AllocConsole()
+            # Выделяем консоль, только если процесс к ней еще не подключен
+            if not kernel32.GetConsoleWindow():
+                kernel32.AllocConsole()
             # Настраиваем кодировку консоли на UTF-8
             kernel32.SetConsoleOutputCP(65001)  # UTF-8
             kernel32.SetConsoleCP(65001)  # UTF-8
             # Перенаправляем stdout и stderr с правильной кодировкой
-            sys.stdout = io.TextIOWrapper(
-                sys.stdout.buffer, 
-                encoding='utf-8', 
-                errors='replace',
-                line_buffering=True
-            )
-            sys.stderr = io.TextIOWrapper(
-                sys.stderr.buffer, 
-                encoding='utf-8', 
-                errors='replace',
-                line_buffering=True
-            )
+            _reconfigure_utf8(sys.stdout)
+            _reconfigure_utf8(sys.stderr)
             print("Консоль отладки активирована (UTF-8)")
         except Exception as e:
             # Если не удалось, просто перенаправляем с правильной кодировкой
             try:
-                sys.stdout = io.TextIOWrapper(
-                    sys.stdout.buffer, 
-                    encoding='utf-8', 
-                    errors='replace',
-                    line_buffering=True
-                )
-                sys.stderr = io.TextIOWrapper(
-                    sys.stderr.buffer, 
-                    encoding='utf-8', 
-                    errors='replace',
-                    line_buffering=True
-                )
+                _reconfigure_utf8(sys.stdout)
+                _reconfigure_utf8(sys.stderr)
                 print(f"Консоль настроена (без AllocConsole): {e}")
             except:
                 pass
 
 
-def excepthook(exc_type, exc_value, exc_traceback):
-    """Обработчик необработанных исключений."""
-    error_msg = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
-    print("=" * 80)
-    print("НЕОБРАБОТАННОЕ ИСКЛЮЧЕНИЕ:")
-    print("=" * 80)
-    print(error_msg)
-    print("=" * 80)
+def make_excepthook(app=None):
+    """
+    Создает обработчик необработанных исключений.
     
-    # Также показываем в GUI, если приложение уже создано
-    try:
-        from PyQt6.QtWidgets import QMessageBox
-        app = QApplication.instance()
-        if app:
+    Args:
+        app: Экземпляр QApplication для показа ошибки в GUI
+            (None, пока приложение не создано)
+    
+    Returns:
+        Функция для sys.excepthook
+    """
+    def excepthook(exc_type, exc_value, exc_traceback):
+        """Обработчик необработанных исключений."""
+        # Трассировка пишется в stderr напрямую, без промежуточной строки
+        # (под pythonw stderr отсутствует - тогда только окно с ошибкой)
+        stderr = sys.stderr
+        if stderr is not None:
+            separator = "=" * 80 + "\n"
+            stderr.write(separator + "НЕОБРАБОТАННОЕ ИСКЛЮЧЕНИЕ:\n" + separator)
+            traceback.print_exception(exc_type, exc_value, exc_traceback, file=stderr)
+            stderr.write(separator)
+            stderr.flush()
+        
+        # Также показываем в GUI, если приложение уже создано
+        if app is None:
+            return
+        try:
             QMessageBox.critical(
                 None, 
                 "Критическая ошибка", 
                 f"Произошла критическая ошибка:\n\n{str(exc_value)}\n\n"
                 f"Подробности в консоли."
             )
-    except:
-        pass
+        except:
+            pass
+    
+    return excepthook
 
 
 def main():
@@ -116,18 +108,13 @@ def main():
     setup_console()
     
     # Устанавливаем обработчик исключений
-    sys.excepthook = excepthook
-    
-    # Устанавливаем кодировку по умолчанию
-    import locale
-    try:
-        locale.setlocale(locale.LC_ALL, '')
-    except:
-        pass
+    sys.excepthook = make_excepthook()
     
     try:
         # Создаем приложение PyQt
         app = QApplication(sys.argv)
+        # С этого момента ошибки показываются и в GUI
+        sys.excepthook = make_excepthook(app)
         
         # Устанавливаем иконку приложения
         app_icon = create_cloud_icon(64)
@@ -136,6 +123,11 @@ def main():
         # Устанавливаем стиль приложения
         app.setStyle('Fusion')
         
+        # OpenGL для графиков включается один раз для всего процесса,
+        # если платформа его поддерживает (до создания виджетов pyqtgraph)
+        import pyqtgraph as pg
+        pg.setConfigOption('useOpenGL', opengl_available())
+        
         # Создаем и показываем главное окно
         window = MainWindow()
         window.show()
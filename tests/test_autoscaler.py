@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Проверки контроллера автомасштабирования.
+
+Запуск: python -m unittest discover tests
+"""
+
+import unittest
+
+import simpy
+
+from model import AutoScaler, CloudSystemModel, LoadBalancer
+
+
+class AutoScalerTest(unittest.TestCase):
+    """Решения AutoScaler на коротких прогонах модели."""
+    
+    def test_no_scale_down_when_nothing_finishes_in_interval(self):
+        """
+        Время обработки больше интервала контроля: в большинстве интервалов
+        ни один запрос не завершается, но система перегружена, и узлы
+        не должны удаляться.
+        """
+        env = simpy.Environment()
+        model = CloudSystemModel(
+            env,
+            lambda_rate=0.5,
+            service_time_min=20.0,
+            service_time_max=25.0,
+            net_delay_min=0.0,
+            net_delay_max=0.0,
+            max_requests_in_flight=500,
+            initial_nodes=3,
+            seed=1,
+        )
+        # Верхний порог недостижим: проверяется только уменьшение масштаба
+        autoscaler = AutoScaler(
+            env,
+            model,
+            min_nodes=1,
+            max_nodes=3,
+            low_threshold=2.0,
+            high_threshold=1000.0,
+            control_interval=5.0,
+            scale_cooldown=30.0,
+        )
+        model.is_running = True
+        autoscaler.is_running = True
+        env.process(model.request_generator())
+        model.start_processors(LoadBalancer())
+        env.process(autoscaler.control_loop())
+        env.run(until=300)
+        
+        self.assertGreater(model.processed_count, 0)
+        self.assertEqual(model.active_count, 3)
+        nodes = [entry['active_nodes'] for entry in autoscaler.metrics_history]
+        self.assertEqual(min(nodes), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,9 +6,20 @@
 обработка, масштабирование, отказы и т.д.
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout
-from PyQt6.QtCore import Qt
-from typing import Optional
+import time
+from datetime import datetime
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout, QAbstractSlider, QFrame
+)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QTextCursor, QPalette, QColor
+from typing import List, Optional
+
+
+# Интервал вывода накопленных записей лога (мс)
+_FLUSH_INTERVAL_MS = 100
+# Максимальное количество строк, хранимых в окне логов
+_MAX_LOG_LINES = 10000
 
 
 class LogsWidget(QWidget):
@@ -21,6 +32,15 @@ class LogsWidget(QWidget):
     def __init__(self):
         """Инициализирует виджет логов."""
         super().__init__()
+        # Записи, ожидающие вывода в текстовое поле
+        self._pending: List[str] = []
+        # Метка времени последней записи: записи одной секунды ее переиспользуют
+        self._stamp_second = -1
+        self._stamp = ""
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
         self.setup_ui()
     
     def setup_ui(self):
@@ -41,14 +61,22 @@ class LogsWidget(QWidget):
         # Текстовое поле для логов
         self.logs_text = QTextEdit()
         self.logs_text.setReadOnly(True)
+        # Лог только дописывается: старые строки отбрасываются самим Qt,
+        # стек отмены и перенос строк не нужны
+        self.logs_text.document().setMaximumBlockCount(_MAX_LOG_LINES)
+        self.logs_text.setUndoRedoEnabled(False)
+        self.logs_text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         self.logs_text.setFontFamily("Consolas")
         self.logs_text.setFontPointSize(9)
-        self.logs_text.setStyleSheet(
-            "background-color: #1e1e1e; "
-            "color: #d4d4d4; "
-            "border: 1px solid #3c3c3c;"
-        )
+        # Темная тема задается палитрой, а не таблицей стилей
+        palette = self.logs_text.palette()
+        palette.setColor(QPalette.ColorRole.Base, QColor("#1e1e1e"))
+        palette.setColor(QPalette.ColorRole.Text, QColor("#d4d4d4"))
+        palette.setColor(QPalette.ColorRole.WindowText, QColor("#3c3c3c"))  # рамка
+        self.logs_text.setPalette(palette)
+        self.logs_text.setFrameShape(QFrame.Shape.Box)
         layout.addWidget(self.logs_text)
+        self._scroll = self.logs_text.verticalScrollBar()
     
     def add_log(self, message: str, level: str = "INFO"):
         """
@@ -58,20 +86,38 @@ class LogsWidget(QWidget):
             message: Текст сообщения
             level: Уровень логирования (INFO, WARNING, ERROR)
         """
-        from datetime import datetime
-        # Форматируем сообщение с временной меткой
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] [{level}] {message}"
+        # Форматируем сообщение с временной меткой (время поступления записи)
+        second = int(time.time())
+        if second != self._stamp_second:
+            now = datetime.fromtimestamp(second)
+            self._stamp_second = second
+            self._stamp = f"[{now.hour:02d}:{now.minute:02d}:{now.second:02d}] "
+        self._pending.append(f"{self._stamp}[{level}] {message}")
+        
+        # Записи выводятся в текстовое поле пачкой по таймеру
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush(self):
+        """Выводит накопленные записи одной вставкой и прокручивает вниз."""
+        if not self._pending:
+            return
+        text = '\n'.join(self._pending)
+        self._pending.clear()
+        if not self.logs_text.document().isEmpty():
+            text = '\n' + text
         
-        # Добавляем в текстовое поле
-        self.logs_text.append(formatted_message)
+        cursor = self.logs_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
         
         # Прокручиваем вниз
-        scrollbar = self.logs_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self._scroll.triggerAction(QAbstractSlider.SliderAction.SliderToMaximum)
     
     def clear_logs(self):
         """Очищает все логи."""
+        self._flush_timer.stop()
+        self._pending.clear()
         self.logs_text.clear()
     
     def reset(self):
@@ -10,15 +10,12 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QStatusBar, QMenuBar, QMenu, QMessageBox, QDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread
 from utils.icon_creator import create_cloud_icon
 from .settings_panel import SettingsPanel
 from .plots_widget import PlotsWidget
 from .stats_widget import StatsWidget
-from .visualization import SystemVisualization
 from .logs_widget import LogsWidget
-from .simulation_thread import SimulationThread
-from .presets_dialog import PresetsDialog
 
 
 class MainWindow(QMainWindow):
@@ -61,13 +58,13 @@ class MainWindow(QMainWindow):
         # Создаем виджеты для вкладок
         self.plots_widget = PlotsWidget()
         self.stats_widget = StatsWidget()
-        self.visualization_widget = SystemVisualization()
         self.logs_widget = LogsWidget()
         
         # Добавляем вкладки
         self.tabs.addTab(self.plots_widget, "Графики")
         self.tabs.addTab(self.stats_widget, "Статистика")
-        # self.tabs.addTab(self.visualization_widget, "Визуализация")  # Временно скрыто
+        # Вкладка "Визуализация" (SystemVisualization) временно скрыта;
+        # виджет не создается, пока вкладка не будет включена
         self.tabs.addTab(self.logs_widget, "Логи")
         
         # Создаем меню
@@ -76,8 +73,14 @@ class MainWindow(QMainWindow):
         # Создаем статусную строку
         self.statusBar().showMessage("Готово к запуску")
         
-        # Поток симуляции
+        # Поток симуляции и выполняемый в нем рабочий объект
         self.simulation_thread = None
+        self.simulation_worker = None
+        
+        # Окно ошибки симуляции создается один раз и показывается без блокировки
+        self._error_box = QMessageBox(self)
+        self._error_box.setIcon(QMessageBox.Icon.Critical)
+        self._error_box.setWindowTitle("Ошибка симуляции")
         
         # Соединяем сигналы от панели настроек
         self._connect_signals()
@@ -105,6 +108,8 @@ class MainWindow(QMainWindow):
     
     def _load_preset(self):
         """Открывает диалог выбора пресета и применяет выбранный пресет."""
+        from .presets_dialog import PresetsDialog
+        
         dialog = PresetsDialog(self)
         result = dialog.exec()
         if result == QDialog.DialogCode.Accepted:
@@ -159,16 +164,28 @@ class MainWindow(QMainWindow):
         self.add_log("НАЧАЛО НОВОЙ СИМУЛЯЦИИ", "INFO")
         self.add_log("=" * 60, "INFO")
         
-        # Создаем новый поток симуляции
-        self.simulation_thread = SimulationThread(settings)
+        # Создаем рабочий объект симуляции и переносим его в новый поток
+        from .simulation_thread import SimulationWorker
+        self.simulation_thread = QThread()
+        self.simulation_worker = SimulationWorker(settings)
+        self.simulation_worker.moveToThread(self.simulation_thread)
+        self.simulation_thread.started.connect(self.simulation_worker.run)
+        
+        # Поток завершается сразу из рабочего объекта (quit потокобезопасен),
+        # чтобы stop_simulation не ждал обработки очереди GUI
+        for signal in (self.simulation_worker.finished_signal, self.simulation_worker.error_signal):
+            signal.connect(self.simulation_thread.quit, Qt.ConnectionType.DirectConnection)
+        
+        # После остановки потока рабочий объект и поток удаляются
+        self.simulation_thread.finished.connect(self.simulation_worker.deleteLater)
+        self.simulation_thread.finished.connect(self.simulation_thread.deleteLater)
+        self.simulation_thread.finished.connect(self.on_thread_finished)
         
         # Подключаем сигналы
-        self.simulation_thread.state_updated.connect(self.update_visualization)
-        self.simulation_thread.metrics_updated.connect(self.update_plots)
-        self.simulation_thread.stats_updated.connect(self.update_stats)
-        self.simulation_thread.log_signal.connect(self.add_log)
-        self.simulation_thread.finished_signal.connect(self.on_simulation_finished)
-        self.simulation_thread.error_signal.connect(self.on_simulation_error)
+        self.simulation_worker.frame_updated.connect(self.on_frame_updated)
+        self.simulation_worker.log_signal.connect(self.add_log)
+        self.simulation_worker.finished_signal.connect(self.on_simulation_finished)
+        self.simulation_worker.error_signal.connect(self.on_simulation_error)
         
         # Обновляем состояние кнопок
         self.settings_panel.set_controls_enabled(running=True, paused=False)
@@ -180,7 +197,7 @@ class MainWindow(QMainWindow):
     def pause_simulation(self):
         """Приостанавливает симуляцию."""
         if self.simulation_thread and self.simulation_thread.isRunning():
-            self.simulation_thread.pause()
+            self.simulation_worker.pause()
             self.add_log("Симуляция приостановлена", "INFO")
             self.settings_panel.set_controls_enabled(running=True, paused=True)
             self.update_status("Симуляция на паузе")
@@ -188,7 +205,7 @@ class MainWindow(QMainWindow):
     def resume_simulation(self):
         """Возобновляет симуляцию."""
         if self.simulation_thread and self.simulation_thread.isRunning():
-            self.simulation_thread.resume()
+            self.simulation_worker.resume()
             self.add_log("Симуляция возобновлена", "INFO")
             self.settings_panel.set_controls_enabled(running=True, paused=False)
             self.update_status("Симуляция продолжается...")
@@ -197,7 +214,7 @@ class MainWindow(QMainWindow):
         """Останавливает симуляцию."""
         if self.simulation_thread and self.simulation_thread.isRunning():
             self.add_log("Остановка симуляции...", "INFO")
-            self.simulation_thread.stop()
+            self.simulation_worker.stop()
             self.simulation_thread.wait(3000)  # Ждем до 3 секунд
             self.settings_panel.set_controls_enabled(running=False, paused=False)
             self.update_status("Симуляция остановлена")
@@ -220,6 +237,13 @@ class MainWindow(QMainWindow):
         """
         self.logs_widget.add_log(message, level)
     
+    def on_thread_finished(self):
+        """Сбрасывает ссылки на завершившийся поток симуляции перед его удалением."""
+        # Ссылки уже могут указывать на поток, запущенный позже
+        if self.sender() is self.simulation_thread:
+            self.simulation_thread = None
+            self.simulation_worker = None
+    
     def on_simulation_finished(self):
         """Обработчик завершения симуляции."""
         self.settings_panel.set_controls_enabled(running=False, paused=False)
@@ -228,12 +252,13 @@ class MainWindow(QMainWindow):
     def on_simulation_error(self, error_message: str):
         """Обработчик ошибки симуляции."""
         print(f"Ошибка симуляции получена в GUI: {error_message}")
-        QMessageBox.critical(
-            self, 
-            "Ошибка симуляции", 
-            f"Произошла ошибка:\n{error_message}\n\n"
-            f"Подробная информация выведена в консоль."
-        )
+        # Пока окно с предыдущей ошибкой открыто, новые не показываем
+        if not self._error_box.isVisible():
+            self._error_box.setText(
+                f"Произошла ошибка:\n{error_message}\n\n"
+                f"Подробная информация выведена в консоль."
+            )
+            self._error_box.show()
         self.settings_panel.set_controls_enabled(running=False, paused=False)
         self.update_status("Ошибка при выполнении симуляции")
     
@@ -255,14 +280,32 @@ class MainWindow(QMainWindow):
         """
         self.statusBar().showMessage(message)
     
-    def update_plots(self, time_series: dict):
+    def on_frame_updated(self, frame: dict):
+        """
+        Распределяет кадр обновления из потока симуляции по виджетам.
+        
+        Args:
+            frame: Словарь с ключами 'state', 'time_series' и 'stats'
+        """
+        # Кадры, оставшиеся в очереди от предыдущей симуляции, пропускаем
+        if self.simulation_worker is None or self.sender() is not self.simulation_worker:
+            return
+        self.update_plots(*frame['time_series'])
+        self.update_stats(frame['stats'])
+        self.update_visualization(frame['state'])
+        self.simulation_worker.frame_processed()
+    
+    def update_plots(self, t, q, n, r):
         """
-        Обновляет графики новыми данными.
+        Добавляет на графики новые точки.
         
         Args:
-            time_series: Словарь с временными рядами
+            t: Массив времени точек, добавленных с прошлого обновления
+            q: Массив длин очереди
+            n: Массив количества узлов
+            r: Массив средних времен отклика
         """
-        self.plots_widget.update_data(time_series)
+        self.plots_widget.append_data(t, q, n, r)
     
     def update_stats(self, metrics: dict):
         """
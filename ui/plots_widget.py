@@ -8,10 +8,25 @@
 - Среднее время отклика
 """
 
+import time
+import numpy as np
 import pyqtgraph as pg
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSplitter
-from PyQt6.QtCore import Qt
-from typing import Dict, List
+from collections import deque
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from PyQt6.QtCore import Qt, QTimer
+
+
+# Интервал перерисовки графиков (мс): обычный и при перегрузке GUI
+_FLUSH_INTERVAL_MS = 16
+_FLUSH_INTERVAL_SLOW_MS = 33
+
+# Глобальные настройки pyqtgraph задаются до создания PlotWidget;
+# useOpenGL выставляется один раз при запуске приложения (см. run_app.main)
+pg.setConfigOptions(
+    antialias=False,
+    enableExperimental=True,
+    useNumba=False,
+)
 
 
 class PlotsWidget(QWidget):
@@ -34,9 +49,7 @@ class PlotsWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         
-        # Разделитель для трех графиков
-        splitter = QSplitter(Qt.Orientation.Vertical)
-        
+        # Три графика равной высоты друг под другом
         # График 1: Длина очереди
         self.queue_plot = pg.PlotWidget(title="Длина очереди")
         self.queue_plot.setLabel('left', 'Запросов в очереди')
@@ -44,7 +57,7 @@ class PlotsWidget(QWidget):
         self.queue_plot.showGrid(x=True, y=True, alpha=0.3)
         self.queue_plot.setYRange(0, 50, padding=0)
         self.queue_curve = self.queue_plot.plot(pen=pg.mkPen(color='r', width=2))
-        splitter.addWidget(self.queue_plot)
+        layout.addWidget(self.queue_plot, stretch=1)
         
         # График 2: Количество узлов
         self.nodes_plot = pg.PlotWidget(title="Количество активных узлов")
@@ -53,7 +66,7 @@ class PlotsWidget(QWidget):
         self.nodes_plot.showGrid(x=True, y=True, alpha=0.3)
         self.nodes_plot.setYRange(0, 15, padding=0)
         self.nodes_curve = self.nodes_plot.plot(pen=pg.mkPen(color='b', width=2))
-        splitter.addWidget(self.nodes_plot)
+        layout.addWidget(self.nodes_plot, stretch=1)
         
         # График 3: Среднее время отклика
         self.response_plot = pg.PlotWidget(title="Среднее время отклика")
@@ -62,77 +75,141 @@ class PlotsWidget(QWidget):
         self.response_plot.showGrid(x=True, y=True, alpha=0.3)
         self.response_plot.setYRange(0, 10, padding=0)
         self.response_curve = self.response_plot.plot(pen=pg.mkPen(color='g', width=2))
-        splitter.addWidget(self.response_plot)
+        layout.addWidget(self.response_plot, stretch=1)
         
-        # Устанавливаем равные размеры для графиков
-        splitter.setSizes([333, 333, 334])
+        # Настройки отрисовки: без сглаживания, только видимая часть,
+        # прореживание точек при нехватке пикселей
+        for plot in (self.queue_plot, self.nodes_plot, self.response_plot):
+            plot.setAntialiasing(False)
+            plot.hideButtons()
+            plot.setClipToView(True)
+            plot.setDownsampling(auto=True, mode='peak')
+            # Фон графика непрозрачный: Qt не перерисовывает под ним родителя
+            plot.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+            plot.setAutoFillBackground(False)
+            # Диапазоны задаются только кодом (ось X - общая через xlink)
+            plot.setMouseEnabled(x=False, y=False)
         
-        layout.addWidget(splitter)
-        
-        # Данные для графиков
-        self.time_data: List[float] = []
-        self.queue_data: List[int] = []
-        self.nodes_data: List[int] = []
-        self.response_data: List[float] = []
+        # Общая ось X: диапазон задается один раз для всех графиков
+        self.nodes_plot.setXLink(self.queue_plot)
+        self.response_plot.setXLink(self.queue_plot)
         
         # Максимальное количество точек для отображения (для производительности)
         self.max_points = 5000
+        
+        # Данные для графиков: кольцевые буферы на max_points точек,
+        # _head - позиция следующей записи, _size - количество точек
+        self._t = np.empty(self.max_points, dtype=np.float64)
+        self._q = np.empty(self.max_points, dtype=np.int32)
+        self._n = np.empty(self.max_points, dtype=np.int32)
+        self._r = np.empty(self.max_points, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+        
+        # Перерисовка откладывается и выполняется не чаще одного раза за интервал
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
+        # Длительности последних перерисовок (с) для выбора интервала
+        self._flush_durations = deque(maxlen=10)
     
-    def update_data(self, time_series: Dict[str, List]):
+    def append_data(
+        self, t_new: np.ndarray, q_new: np.ndarray, n_new: np.ndarray, r_new: np.ndarray
+    ):
         """
-        Обновляет графики новыми данными.
+        Добавляет на графики новые точки.
+        
+        Массивы содержат только точки, добавленные с прошлого обновления.
         
         Args:
-            time_series: Словарь с временными рядами:
-                - 'time': список времени
-                - 'queue_length': список длин очереди
-                - 'nodes_count': список количества узлов
-                - 'avg_response_time': список средних времен отклика
+            t_new: Время моделирования
+            q_new: Длина очереди
+            n_new: Количество активных узлов
+            r_new: Среднее время отклика
         """
-        time = time_series.get('time', [])
-        queue_length = time_series.get('queue_length', [])
-        nodes_count = time_series.get('nodes_count', [])
-        avg_response_time = time_series.get('avg_response_time', [])
-        
-        # Обновляем данные
-        self.time_data = time
-        self.queue_data = queue_length
-        self.nodes_data = nodes_count
-        self.response_data = avg_response_time
-        
-        # Ограничиваем количество точек для производительности
-        if len(self.time_data) > self.max_points:
-            # Берем последние max_points точек
-            start_idx = len(self.time_data) - self.max_points
-            self.time_data = self.time_data[start_idx:]
-            self.queue_data = self.queue_data[start_idx:]
-            self.nodes_data = self.nodes_data[start_idx:]
-            self.response_data = self.response_data[start_idx:]
-        
-        # Обновляем графики
-        if self.time_data:
-            self.queue_curve.setData(self.time_data, self.queue_data)
-            self.nodes_curve.setData(self.time_data, self.nodes_data)
-            self.response_curve.setData(self.time_data, self.response_data)
+        count = len(t_new)
+        if count == 0:
+            return
+        
+        # Записываем новые точки в кольцевые буферы
+        for buf, values in (
+            (self._t, t_new), (self._q, q_new), (self._n, n_new), (self._r, r_new)
+        ):
+            self._append(buf, values)
+        self._head = (self._head + count) % self.max_points
+        self._size = min(self._size + count, self.max_points)
+        
+        # Графики перерисуются по таймеру вместе с другими накопившимися точками
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush(self):
+        """Перерисовывает графики по данным кольцевых буферов."""
+        started = time.perf_counter()
+        
+        time_data = self._view(self._t)
+        self.queue_curve.setData(x=time_data, y=self._view(self._q), connect='all', skipFiniteCheck=True)
+        self.nodes_curve.setData(x=time_data, y=self._view(self._n), connect='all', skipFiniteCheck=True)
+        self.response_curve.setData(x=time_data, y=self._view(self._r), connect='all', skipFiniteCheck=True)
+        
+        # Автоматическое масштабирование по X
+        # (время возрастает, поэтому границы - первая и последняя точки;
+        # остальные графики следуют за queue_plot через setXLink)
+        if len(time_data) > 1:
+            x_min = time_data[0]
+            x_max = time_data[-1]
+            x_range = x_max - x_min
+            if x_range > 0:
+                self.queue_plot.setXRange(x_min - x_range * 0.05, x_max + x_range * 0.05, padding=0)
+        
+        # Если перерисовка в среднем не укладывается в интервал, реже перерисовываем
+        self._flush_durations.append(time.perf_counter() - started)
+        avg_ms = sum(self._flush_durations) / len(self._flush_durations) * 1000.0
+        self._flush_timer.setInterval(
+            _FLUSH_INTERVAL_SLOW_MS if avg_ms > _FLUSH_INTERVAL_MS else _FLUSH_INTERVAL_MS
+        )
+    
+    def _append(self, buf: np.ndarray, values: np.ndarray):
+        """
+        Записывает значения в кольцевой буфер начиная с позиции _head.
+        
+        Args:
+            buf: Кольцевой буфер
+            values: Новые значения
+        """
+        size = len(buf)
+        count = len(values)
+        if count > size:
+            # В буфер помещаются только последние size значений
+            values = values[-size:]
+        start = (self._head + count - len(values)) % size
+        first = min(len(values), size - start)
+        np.copyto(buf[start:start + first], values[:first], casting='unsafe')
+        np.copyto(buf[:len(values) - first], values[first:], casting='unsafe')
+    
+    def _view(self, buf: np.ndarray) -> np.ndarray:
+        """
+        Возвращает точки буфера в хронологическом порядке.
+        
+        Args:
+            buf: Кольцевой буфер
             
-            # Автоматическое масштабирование по X
-            if len(self.time_data) > 1:
-                x_min = min(self.time_data)
-                x_max = max(self.time_data)
-                x_range = x_max - x_min
-                if x_range > 0:
-                    self.queue_plot.setXRange(x_min - x_range * 0.05, x_max + x_range * 0.05, padding=0)
-                    self.nodes_plot.setXRange(x_min - x_range * 0.05, x_max + x_range * 0.05, padding=0)
-                    self.response_plot.setXRange(x_min - x_range * 0.05, x_max + x_range * 0.05, padding=0)
+        Returns:
+            Срез буфера или, если запись перешла через конец, склеенный массив
+        """
+        if self._size < self.max_points:
+            return buf[:self._size]
+        if self._head == 0:
+            return buf
+        return np.concatenate((buf[self._head:], buf[:self._head]))
     
     def reset(self):
         """Сбрасывает все графики."""
-        self.time_data.clear()
-        self.queue_data.clear()
-        self.nodes_data.clear()
-        self.response_data.clear()
+        self._flush_timer.stop()
+        self._head = 0
+        self._size = 0
         
         self.queue_curve.setData([], [])
         self.nodes_curve.setData([], [])
         self.response_curve.setData([], [])
-
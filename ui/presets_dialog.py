@@ -7,10 +7,14 @@
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QTextEdit,
-    QPushButton, QLabel, QDialogButtonBox
+    QPushButton, QLabel, QDialogButtonBox, QFrame
 )
 from PyQt6.QtCore import Qt
-from utils.presets import PRESETS, Preset
+from PyQt6.QtGui import QPalette, QColor
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from utils.presets import Preset
 
 
 class PresetsDialog(QDialog):
@@ -26,11 +30,16 @@ class PresetsDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Эксперименты - Выбор пресета")
         self.setMinimumSize(700, 500)
-        self.selected_preset: Preset = None
+        self.selected_preset: Optional['Preset'] = None
+        # Список пресетов загружается при построении интерфейса
+        self._presets: List['Preset'] = []
         self.setup_ui()
     
     def setup_ui(self):
         """Создает интерфейс диалога."""
+        from utils.presets import PRESETS
+        self._presets = PRESETS
+        
         layout = QVBoxLayout(self)
         
         # Заголовок
@@ -48,9 +57,7 @@ class PresetsDialog(QDialog):
         
         self.presets_list = QListWidget()
         self.presets_list.setMinimumWidth(300)
-        for preset in PRESETS:
-            self.presets_list.addItem(preset.name)
-        self.presets_list.currentRowChanged.connect(self.on_preset_selected)
+        self.presets_list.addItems([preset.name for preset in PRESETS])
         main_layout.addWidget(self.presets_list, stretch=1)
         
         # Описание справа
@@ -62,13 +69,14 @@ class PresetsDialog(QDialog):
         self.description_text = QTextEdit()
         self.description_text.setReadOnly(True)
         self.description_text.setMinimumHeight(300)
-        # Стиль для читаемости в любой теме
-        self.description_text.setStyleSheet(
-            "background-color: #f5f5f5; "
-            "color: #000000; "
-            "padding: 10px; "
-            "border: 1px solid #cccccc;"
-        )
+        # Цвета для читаемости в любой теме (палитра вместо таблицы стилей)
+        palette = self.description_text.palette()
+        palette.setColor(QPalette.ColorRole.Base, QColor("#f5f5f5"))
+        palette.setColor(QPalette.ColorRole.Text, QColor("#000000"))
+        palette.setColor(QPalette.ColorRole.WindowText, QColor("#cccccc"))  # рамка
+        self.description_text.setPalette(palette)
+        self.description_text.setFrameShape(QFrame.Shape.Box)
+        self.description_text.document().setDocumentMargin(10)
         desc_layout.addWidget(self.description_text)
         
         main_layout.addLayout(desc_layout, stretch=1)
@@ -82,10 +90,12 @@ class PresetsDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
         
-        # Выбираем первый пресет по умолчанию
+        # Выбираем первый пресет по умолчанию; обработчик подключается после,
+        # чтобы описание не отрисовывалось дважды
         if self.presets_list.count() > 0:
             self.presets_list.setCurrentRow(0)
             self.on_preset_selected(0)
+        self.presets_list.currentRowChanged.connect(self.on_preset_selected)
     
     def on_preset_selected(self, row: int):
         """
@@ -94,12 +104,12 @@ class PresetsDialog(QDialog):
         Args:
             row: Индекс выбранного элемента
         """
-        if 0 <= row < len(PRESETS):
-            preset = PRESETS[row]
+        if 0 <= row < len(self._presets):
+            preset = self._presets[row]
             self.selected_preset = preset
             self.description_text.setText(preset.description)
     
-    def get_selected_preset(self) -> Preset:
+    def get_selected_preset(self) -> Optional['Preset']:
         """
         Возвращает выбранный пресет.
         
@@ -10,7 +10,46 @@ from PyQt6.QtWidgets import (
     QDoubleSpinBox, QSpinBox, QPushButton, QGroupBox,
     QFormLayout
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QSignalBlocker, pyqtSignal
+
+
+# Поля ввода по группам:
+# (атрибут, подпись, минимум, максимум, значение, шаг, знаков после запятой,
+#  текст специального значения); decimals=None - целочисленное поле
+_SPIN_GROUPS = (
+    ("Параметры нагрузки", (
+        ('lambda_spin', "λ (интенсивность):", 0.1, 100.0, 2.0, 0.1, 2, None),
+        ('service_time_min_spin', "Время обработки (мин):", 0.1, 10.0, 0.5, 0.1, 2, None),
+        ('service_time_max_spin', "Время обработки (макс):", 0.1, 10.0, 2.0, 0.1, 2, None),
+    )),
+    ("Параметры сети", (
+        ('net_delay_min_spin', "Задержка сети (мин):", 0.0, 1.0, 0.0, 0.01, 3, None),
+        ('net_delay_max_spin', "Задержка сети (макс):", 0.0, 1.0, 0.1, 0.01, 3, None),
+        ('max_requests_spin', "Макс. запросов:", 0, 1000, 100, None, None, "Без ограничений"),
+    )),
+    ("Автомасштабирование", (
+        ('min_nodes_spin', "Мин. узлов:", 1, 50, 1, None, None, None),
+        ('max_nodes_spin', "Макс. узлов:", 1, 50, 10, None, None, None),
+        ('initial_nodes_spin', "Начальных узлов:", 1, 50, 2, None, None, None),
+        ('low_threshold_spin', "Нижний порог:", 0.0, 100.0, 2.0, 0.5, 1, None),
+        ('high_threshold_spin', "Верхний порог:", 0.0, 100.0, 10.0, 0.5, 1, None),
+        ('control_interval_spin', "Интервал контроля:", 0.5, 60.0, 5.0, 0.5, 1, None),
+        ('scale_cooldown_spin', "Cooldown:", 0.5, 60.0, 10.0, 0.5, 1, None),
+    )),
+    ("Симуляция", (
+        ('sim_duration_spin', "Длительность:", 1.0, 10000.0, 100.0, 10.0, 1, None),
+    )),
+    ("SLA и отказы", (
+        ('sla_threshold_spin', "SLA порог (макс. время отклика):", 0.1, 100.0, 5.0, 0.5, 2, "Не задан"),
+        ('max_wait_time_spin', "Макс. время ожидания в очереди:", 0.0, 100.0, 10.0, 0.5, 2, "Без ограничений"),
+    )),
+)
+
+# Таблица стилей панели (кнопки выбираются по objectName)
+_PANEL_QSS = (
+    "QPushButton#startBtn { background-color: #4CAF50; color: white; font-weight: bold; }"
+    "QPushButton#stopBtn { background-color: #f44336; color: white; font-weight: bold; }"
+)
 
 
 class SettingsPanel(QWidget):
@@ -36,159 +75,58 @@ class SettingsPanel(QWidget):
         super().__init__()
         self.setFixedWidth(350)
         self.setup_ui()
+        
+        # Параметр модели -> (поле, значение поля, означающее None)
+        self._preset_map = {
+            # Параметры нагрузки
+            'lambda_rate': (self.lambda_spin, None),
+            'service_time_min': (self.service_time_min_spin, None),
+            'service_time_max': (self.service_time_max_spin, None),
+            # Параметры сети
+            'net_delay_min': (self.net_delay_min_spin, None),
+            'net_delay_max': (self.net_delay_max_spin, None),
+            'max_requests_in_flight': (self.max_requests_spin, 0),
+            # Автомасштабирование
+            'min_nodes': (self.min_nodes_spin, None),
+            'max_nodes': (self.max_nodes_spin, None),
+            'initial_nodes': (self.initial_nodes_spin, None),
+            'low_threshold': (self.low_threshold_spin, None),
+            'high_threshold': (self.high_threshold_spin, None),
+            'control_interval': (self.control_interval_spin, None),
+            'scale_cooldown': (self.scale_cooldown_spin, None),
+            # Симуляция
+            'simulation_duration': (self.sim_duration_spin, None),
+            # SLA и отказы
+            'sla_threshold': (self.sla_threshold_spin, 0),
+            'max_wait_time': (self.max_wait_time_spin, 0),
+        }
     
     def setup_ui(self):
         """Создает интерфейс панели настроек."""
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         
-        # Группа: Параметры нагрузки
-        load_group = QGroupBox("Параметры нагрузки")
-        load_layout = QFormLayout()
-        
-        self.lambda_spin = QDoubleSpinBox()
-        self.lambda_spin.setRange(0.1, 100.0)
-        self.lambda_spin.setValue(2.0)
-        self.lambda_spin.setSingleStep(0.1)
-        self.lambda_spin.setDecimals(2)
-        load_layout.addRow("λ (интенсивность):", self.lambda_spin)
-        
-        self.service_time_min_spin = QDoubleSpinBox()
-        self.service_time_min_spin.setRange(0.1, 10.0)
-        self.service_time_min_spin.setValue(0.5)
-        self.service_time_min_spin.setSingleStep(0.1)
-        self.service_time_min_spin.setDecimals(2)
-        load_layout.addRow("Время обработки (мин):", self.service_time_min_spin)
-        
-        self.service_time_max_spin = QDoubleSpinBox()
-        self.service_time_max_spin.setRange(0.1, 10.0)
-        self.service_time_max_spin.setValue(2.0)
-        self.service_time_max_spin.setSingleStep(0.1)
-        self.service_time_max_spin.setDecimals(2)
-        load_layout.addRow("Время обработки (макс):", self.service_time_max_spin)
-        
-        load_group.setLayout(load_layout)
-        layout.addWidget(load_group)
-        
-        # Группа: Параметры сети
-        network_group = QGroupBox("Параметры сети")
-        network_layout = QFormLayout()
-        
-        self.net_delay_min_spin = QDoubleSpinBox()
-        self.net_delay_min_spin.setRange(0.0, 1.0)
-        self.net_delay_min_spin.setValue(0.0)
-        self.net_delay_min_spin.setSingleStep(0.01)
-        self.net_delay_min_spin.setDecimals(3)
-        network_layout.addRow("Задержка сети (мин):", self.net_delay_min_spin)
-        
-        self.net_delay_max_spin = QDoubleSpinBox()
-        self.net_delay_max_spin.setRange(0.0, 1.0)
-        self.net_delay_max_spin.setValue(0.1)
-        self.net_delay_max_spin.setSingleStep(0.01)
-        self.net_delay_max_spin.setDecimals(3)
-        network_layout.addRow("Задержка сети (макс):", self.net_delay_max_spin)
-        
-        self.max_requests_spin = QSpinBox()
-        self.max_requests_spin.setRange(0, 1000)
-        self.max_requests_spin.setValue(100)
-        self.max_requests_spin.setSpecialValueText("Без ограничений")
-        network_layout.addRow("Макс. запросов:", self.max_requests_spin)
-        
-        network_group.setLayout(network_layout)
-        layout.addWidget(network_group)
-        
-        # Группа: Автомасштабирование
-        autoscale_group = QGroupBox("Автомасштабирование")
-        autoscale_layout = QFormLayout()
-        
-        self.min_nodes_spin = QSpinBox()
-        self.min_nodes_spin.setRange(1, 50)
-        self.min_nodes_spin.setValue(1)
-        autoscale_layout.addRow("Мин. узлов:", self.min_nodes_spin)
-        
-        self.max_nodes_spin = QSpinBox()
-        self.max_nodes_spin.setRange(1, 50)
-        self.max_nodes_spin.setValue(10)
-        autoscale_layout.addRow("Макс. узлов:", self.max_nodes_spin)
-        
-        self.initial_nodes_spin = QSpinBox()
-        self.initial_nodes_spin.setRange(1, 50)
-        self.initial_nodes_spin.setValue(2)
-        autoscale_layout.addRow("Начальных узлов:", self.initial_nodes_spin)
-        
-        self.low_threshold_spin = QDoubleSpinBox()
-        self.low_threshold_spin.setRange(0.0, 100.0)
-        self.low_threshold_spin.setValue(2.0)
-        self.low_threshold_spin.setSingleStep(0.5)
-        self.low_threshold_spin.setDecimals(1)
-        autoscale_layout.addRow("Нижний порог:", self.low_threshold_spin)
-        
-        self.high_threshold_spin = QDoubleSpinBox()
-        self.high_threshold_spin.setRange(0.0, 100.0)
-        self.high_threshold_spin.setValue(10.0)
-        self.high_threshold_spin.setSingleStep(0.5)
-        self.high_threshold_spin.setDecimals(1)
-        autoscale_layout.addRow("Верхний порог:", self.high_threshold_spin)
-        
-        self.control_interval_spin = QDoubleSpinBox()
-        self.control_interval_spin.setRange(0.5, 60.0)
-        self.control_interval_spin.setValue(5.0)
-        self.control_interval_spin.setSingleStep(0.5)
-        self.control_interval_spin.setDecimals(1)
-        autoscale_layout.addRow("Интервал контроля:", self.control_interval_spin)
-        
-        self.scale_cooldown_spin = QDoubleSpinBox()
-        self.scale_cooldown_spin.setRange(0.5, 60.0)
-        self.scale_cooldown_spin.setValue(10.0)
-        self.scale_cooldown_spin.setSingleStep(0.5)
-        self.scale_cooldown_spin.setDecimals(1)
-        autoscale_layout.addRow("Cooldown:", self.scale_cooldown_spin)
-        
-        autoscale_group.setLayout(autoscale_layout)
-        layout.addWidget(autoscale_group)
-        
-        # Группа: Симуляция
-        sim_group = QGroupBox("Симуляция")
-        sim_layout = QFormLayout()
-        
-        self.sim_duration_spin = QDoubleSpinBox()
-        self.sim_duration_spin.setRange(1.0, 10000.0)
-        self.sim_duration_spin.setValue(100.0)
-        self.sim_duration_spin.setSingleStep(10.0)
-        self.sim_duration_spin.setDecimals(1)
-        sim_layout.addRow("Длительность:", self.sim_duration_spin)
-        
-        sim_group.setLayout(sim_layout)
-        layout.addWidget(sim_group)
-        
-        # Группа: SLA и отказы
-        sla_group = QGroupBox("SLA и отказы")
-        sla_layout = QFormLayout()
-        
-        self.sla_threshold_spin = QDoubleSpinBox()
-        self.sla_threshold_spin.setRange(0.1, 100.0)
-        self.sla_threshold_spin.setValue(5.0)
-        self.sla_threshold_spin.setSingleStep(0.5)
-        self.sla_threshold_spin.setDecimals(2)
-        self.sla_threshold_spin.setSpecialValueText("Не задан")
-        sla_layout.addRow("SLA порог (макс. время отклика):", self.sla_threshold_spin)
-        
-        self.max_wait_time_spin = QDoubleSpinBox()
-        self.max_wait_time_spin.setRange(0.0, 100.0)
-        self.max_wait_time_spin.setValue(10.0)
-        self.max_wait_time_spin.setSingleStep(0.5)
-        self.max_wait_time_spin.setDecimals(2)
-        self.max_wait_time_spin.setSpecialValueText("Без ограничений")
-        sla_layout.addRow("Макс. время ожидания в очереди:", self.max_wait_time_spin)
-        
-        sla_group.setLayout(sla_layout)
-        layout.addWidget(sla_group)
+        # Группы полей ввода параметров (см. _SPIN_GROUPS)
+        for title, fields in _SPIN_GROUPS:
+            group = QGroupBox(title)
+            form_layout = QFormLayout()
+            for attr, label, minimum, maximum, value, step, decimals, special_text in fields:
+                if decimals is None:
+                    spin = self._make_ispin(minimum, maximum, value)
+                else:
+                    spin = self._make_dspin(minimum, maximum, value, step=step, decimals=decimals)
+                if special_text:
+                    spin.setSpecialValueText(special_text)
+                setattr(self, attr, spin)
+                form_layout.addRow(label, spin)
+            group.setLayout(form_layout)
+            layout.addWidget(group)
         
         # Кнопки управления
         buttons_layout = QVBoxLayout()
         
         self.start_btn = QPushButton("Старт")
-        self.start_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
+        self.start_btn.setObjectName("startBtn")
         self.start_btn.clicked.connect(self.start_signal.emit)
         buttons_layout.addWidget(self.start_btn)
         
@@ -204,7 +142,7 @@ class SettingsPanel(QWidget):
         
         self.stop_btn = QPushButton("Стоп")
         self.stop_btn.setEnabled(False)
-        self.stop_btn.setStyleSheet("background-color: #f44336; color: white; font-weight: bold;")
+        self.stop_btn.setObjectName("stopBtn")
         self.stop_btn.clicked.connect(self.stop_signal.emit)
         buttons_layout.addWidget(self.stop_btn)
         
@@ -214,6 +152,58 @@ class SettingsPanel(QWidget):
         
         layout.addLayout(buttons_layout)
         layout.addStretch()
+        
+        # Стили кнопок задаются одной таблицей стилей на всю панель
+        self.setStyleSheet(_PANEL_QSS)
+    
+    @staticmethod
+    def _make_dspin(
+        minimum: float, maximum: float, value: float, step: float, decimals: int
+    ) -> QDoubleSpinBox:
+        """
+        Создает поле ввода дробного параметра.
+        
+        valueChanged испускается только по Enter или потере фокуса,
+        а не на каждую введенную цифру.
+        
+        Args:
+            minimum: Минимальное значение
+            maximum: Максимальное значение
+            value: Начальное значение
+            step: Шаг изменения
+            decimals: Количество знаков после запятой
+            
+        Returns:
+            Настроенный QDoubleSpinBox
+        """
+        spin = QDoubleSpinBox()
+        spin.setKeyboardTracking(False)
+        spin.setGroupSeparatorShown(False)
+        spin.setRange(minimum, maximum)
+        spin.setDecimals(decimals)
+        spin.setSingleStep(step)
+        spin.setValue(value)
+        return spin
+    
+    @staticmethod
+    def _make_ispin(minimum: int, maximum: int, value: int) -> QSpinBox:
+        """
+        Создает поле ввода целочисленного параметра.
+        
+        Args:
+            minimum: Минимальное значение
+            maximum: Максимальное значение
+            value: Начальное значение
+            
+        Returns:
+            Настроенный QSpinBox
+        """
+        spin = QSpinBox()
+        spin.setKeyboardTracking(False)
+        spin.setGroupSeparatorShown(False)
+        spin.setRange(minimum, maximum)
+        spin.setValue(value)
+        return spin
     
     def get_settings(self) -> dict:
         """
@@ -222,76 +212,40 @@ class SettingsPanel(QWidget):
         Returns:
             Словарь с параметрами модели
         """
-        return {
-            'lambda_rate': self.lambda_spin.value(),
-            'service_time_min': self.service_time_min_spin.value(),
-            'service_time_max': self.service_time_max_spin.value(),
-            'net_delay_min': self.net_delay_min_spin.value(),
-            'net_delay_max': self.net_delay_max_spin.value(),
-            'max_requests_in_flight': self.max_requests_spin.value() if self.max_requests_spin.value() > 0 else None,
-            'min_nodes': self.min_nodes_spin.value(),
-            'max_nodes': self.max_nodes_spin.value(),
-            'initial_nodes': self.initial_nodes_spin.value(),
-            'low_threshold': self.low_threshold_spin.value(),
-            'high_threshold': self.high_threshold_spin.value(),
-            'control_interval': self.control_interval_spin.value(),
-            'scale_cooldown': self.scale_cooldown_spin.value(),
-            'simulation_duration': self.sim_duration_spin.value(),
-            'sla_threshold': self.sla_threshold_spin.value() if self.sla_threshold_spin.value() > 0 else None,
-            'max_wait_time': self.max_wait_time_spin.value() if self.max_wait_time_spin.value() > 0 else None,
-        }
+        settings = {}
+        for key, (widget, none_value) in self._preset_map.items():
+            value = widget.value()
+            # Необязательные параметры: значение none_value означает "не задан"
+            if none_value is not None and value <= none_value:
+                value = None
+            settings[key] = value
+        return settings
     
     def apply_preset(self, params: dict):
         """
         Применяет параметры пресета к полям настроек.
         
+        Сигналы полей блокируются, а перерисовка панели выполняется
+        один раз после установки всех значений.
+        
         Args:
             params: Словарь с параметрами пресета
         """
-        # Параметры нагрузки
-        if 'lambda_rate' in params:
-            self.lambda_spin.setValue(params['lambda_rate'])
-        if 'service_time_min' in params:
-            self.service_time_min_spin.setValue(params['service_time_min'])
-        if 'service_time_max' in params:
-            self.service_time_max_spin.setValue(params['service_time_max'])
-        
-        # Параметры сети
-        if 'net_delay_min' in params:
-            self.net_delay_min_spin.setValue(params['net_delay_min'])
-        if 'net_delay_max' in params:
-            self.net_delay_max_spin.setValue(params['net_delay_max'])
-        if 'max_requests_in_flight' in params:
-            value = params['max_requests_in_flight']
-            self.max_requests_spin.setValue(value if value is not None else 0)
-        
-        # Автомасштабирование
-        if 'min_nodes' in params:
-            self.min_nodes_spin.setValue(params['min_nodes'])
-        if 'max_nodes' in params:
-            self.max_nodes_spin.setValue(params['max_nodes'])
-        if 'initial_nodes' in params:
-            self.initial_nodes_spin.setValue(params['initial_nodes'])
-        if 'low_threshold' in params:
-            self.low_threshold_spin.setValue(params['low_threshold'])
-        if 'high_threshold' in params:
-            self.high_threshold_spin.setValue(params['high_threshold'])
-        if 'control_interval' in params:
-            self.control_interval_spin.setValue(params['control_interval'])
-        if 'scale_cooldown' in params:
-            self.scale_cooldown_spin.setValue(params['scale_cooldown'])
-        
-        # Симуляция
-        if 'simulation_duration' in params:
-            self.sim_duration_spin.setValue(params['simulation_duration'])
-        
-        # SLA и отказы
-        if 'sla_threshold' in params:
-            value = params['sla_threshold']
-            self.sla_threshold_spin.setValue(value if value is not None else 0)
-        if 'max_wait_time' in params:
-            value = params['max_wait_time']
-            self.max_wait_time_spin.setValue(value if value is not None else 0)
+        preset_map = self._preset_map
+        self.setUpdatesEnabled(False)
+        blockers = [QSignalBlocker(widget) for widget, _ in preset_map.values()]
+        try:
+            for key, value in params.items():
+                entry = preset_map.get(key)
+                if entry is None:
+                    continue
+                widget, none_value = entry
+                widget.setValue(none_value if value is None else value)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self.setUpdatesEnabled(True)
+        self.update()
     
     def set_controls_enabled(self, running: bool, paused: bool):
         """
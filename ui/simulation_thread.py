@@ -2,13 +2,14 @@
 """
 Поток симуляции для интеграции SimPy и PyQt.
 
-Запускает симуляцию в отдельном потоке и передает данные в GUI
-через сигналы PyQt.
+Рабочий объект симуляции переносится в отдельный QThread и передает
+данные в GUI через сигналы PyQt.
 """
 
 import simpy
-import time
-from PyQt6.QtCore import QThread, pyqtSignal
+import threading
+from time import perf_counter
+from PyQt6.QtCore import QCoreApplication, QObject, pyqtSignal, pyqtSlot
 from typing import Dict, Any
 
 from model.core import CloudSystemModel
@@ -17,25 +18,37 @@ from model.autoscaler import AutoScaler
 from model.metrics import MetricsCollector
 
 
-class SimulationThread(QThread):
+# Границы шага модельного времени между обновлениями GUI
+_MIN_UPDATE_INTERVAL = 0.05
+_MAX_UPDATE_INTERVAL = 5.0
+# Реальное время одного шага (с), при выходе за которое шаг подстраивается
+_FAST_STEP_SEC = 1 / 60
+_SLOW_STEP_SEC = 1 / 20
+# Шаг модельного времени между снимками для графиков (не зависит от шага GUI)
+_SNAPSHOT_INTERVAL = 0.5
+# Целочисленная единица модельного времени в цикле симуляции (1e-6)
+_TIME_UNIT = 1_000_000
+
+
+class SimulationWorker(QObject):
     """
-    Поток для выполнения симуляции SimPy.
+    Рабочий объект для выполнения симуляции SimPy.
     
-    Запускает модель в отдельном потоке и периодически отправляет
-    обновления состояния в GUI через сигналы.
+    Переносится в отдельный QThread (moveToThread), запускается по сигналу
+    started потока и периодически отправляет обновления состояния в GUI
+    через сигналы.
     """
     
     # Сигналы для передачи данных в GUI
-    state_updated = pyqtSignal(dict)  # Обновление состояния системы
-    metrics_updated = pyqtSignal(dict)  # Обновление временных рядов
-    stats_updated = pyqtSignal(dict)  # Обновление агрегированных метрик
+    # Кадр обновления: состояние системы, новые точки рядов и агрегированные метрики
+    frame_updated = pyqtSignal(dict)
     log_signal = pyqtSignal(str, str)  # Лог сообщение (message, level)
     finished_signal = pyqtSignal()  # Симуляция завершена
     error_signal = pyqtSignal(str)  # Ошибка при симуляции
     
     def __init__(self, settings: Dict[str, Any]):
         """
-        Инициализирует поток симуляции.
+        Инициализирует рабочий объект симуляции.
         
         Args:
             settings: Словарь с параметрами модели
@@ -44,6 +57,11 @@ class SimulationThread(QThread):
         self.settings = settings
         self.is_paused = False
         self.should_stop = False
+        # Кадр отправлен и еще не обработан GUI (сбрасывается в frame_processed)
+        self._frame_pending = threading.Event()
+        # Снимается на время паузы; поток симуляции ждет его без опроса
+        self._resume_event = threading.Event()
+        self._resume_event.set()
         
         # Компоненты модели (будут созданы в run)
         self.env = None
@@ -52,8 +70,9 @@ class SimulationThread(QThread):
         self.autoscaler = None
         self.metrics_collector = None
     
+    @pyqtSlot()
     def run(self):
-        """Запускает симуляцию в потоке."""
+        """Выполняет симуляцию в потоке, в который перенесен объект."""
         try:
             # Создаем SimPy окружение
             self.env = simpy.Environment()
@@ -75,7 +94,7 @@ class SimulationThread(QThread):
             )
             
             # Передаем функцию логирования в модель
-            self.model.set_log_callback(lambda msg, level="INFO": self.log_signal.emit(msg, level))
+            self.model.set_log_callback(self.log_signal.emit)
             
             # Создаем балансировщик нагрузки
             self.load_balancer = LoadBalancer()
@@ -87,9 +106,6 @@ class SimulationThread(QThread):
                 self.log_signal.emit(f"SLA порог установлен: {self.settings['sla_threshold']}", "INFO")
             
             # Создаем автомасштабировщик
-            def get_metrics():
-                return self.metrics_collector.get_current_metrics(self.model)
-            
             self.autoscaler = AutoScaler(
                 env=self.env,
                 model=self.model,
@@ -99,11 +115,10 @@ class SimulationThread(QThread):
                 high_threshold=self.settings['high_threshold'],
                 control_interval=self.settings['control_interval'],
                 scale_cooldown=self.settings['scale_cooldown'],
-                get_metrics_callback=get_metrics,
             )
             
             # Передаем функцию логирования в автомасштабировщик
-            self.autoscaler.set_log_callback(lambda msg, level="INFO": self.log_signal.emit(msg, level))
+            self.autoscaler.set_log_callback(self.log_signal.emit)
             
             # Запускаем процессы
             self.model.is_running = True
@@ -121,7 +136,7 @@ class SimulationThread(QThread):
             self.log_signal.emit("Генератор запросов запущен", "INFO")
             
             # Запускаем обработчик запросов
-            self.env.process(self.model.request_processor(self.load_balancer))
+            self.model.start_processors(self.load_balancer)
             self.log_signal.emit("Обработчик запросов запущен", "INFO")
             
             # Запускаем контроллер автомасштабирования
@@ -130,75 +145,83 @@ class SimulationThread(QThread):
             self.log_signal.emit("Симуляция началась", "INFO")
             
             # Запускаем цикл симуляции с периодическим обновлением GUI
-            update_interval = 0.5  # Обновляем GUI каждые 0.5 единиц времени
-            next_update_time = update_interval
+            # Начальный шаг 0.5 единицы времени; далее он подстраивается так,
+            # чтобы один шаг занимал 1/60-1/20 с реального времени
+            update_interval = 0.5
             
+            # Границы шагов считаются в целых единицах _TIME_UNIT, чтобы
+            # накопление шагов не давало ошибки округления
             simulation_duration = self.settings.get('simulation_duration', 100.0)
+            duration_u = round(simulation_duration * _TIME_UNIT)
+            next_update_u = round(update_interval * _TIME_UNIT)
+            snapshot_u = round(_SNAPSHOT_INTERVAL * _TIME_UNIT)
+            next_snapshot_u = snapshot_u
+            # Момент, до которого симуляция уже продвинута
+            run_u = 0
+            # Количество снимков, уже отправленных в GUI (графики получают только новые точки)
+            series_sent = 0
             
-            while self.env.now < simulation_duration and not self.should_stop:
+            while not self.should_stop:
                 # Продвигаем симуляцию до следующего обновления
-                target_time = min(next_update_time, simulation_duration)
+                target_u = min(next_update_u, duration_u)
                 
-                if not self.is_paused:
-                    self.env.run(until=target_time)
-                else:
-                    # Если на паузе, просто ждем
-                    import time
-                    time.sleep(0.1)
+                if self.is_paused:
+                    # Если на паузе, ждем resume() или stop()
+                    self._resume_event.wait()
                     continue
                 
-                # Обновляем метрики
-                self.metrics_collector.update_requests(
-                    self.model.processed_requests,
-                    self.model.rejected_requests
-                )
-                
-                # Получаем текущие метрики
-                current_metrics = self.metrics_collector.get_current_metrics(self.model)
+                # Пауза модели снимается здесь, в потоке симуляции,
+                # так как resume() пробуждает процессы SimPy
+                if self.model.is_paused:
+                    self.model.resume()
+                step_start = perf_counter()
                 
-                # Записываем снимок состояния
-                self.metrics_collector.record_snapshot(
-                    sim_time=current_metrics['sim_time'],
-                    queue_length=current_metrics['queue_length'],
-                    nodes_count=current_metrics['active_nodes'],
-                    avg_response_time=current_metrics['avg_response_time'],
-                )
+                # Снимок записывается на каждой границе _SNAPSHOT_INTERVAL внутри шага,
+                # поэтому плотность точек на графиках не зависит от длины шага
+                while next_snapshot_u <= target_u:
+                    self.env.run(until=next_snapshot_u / _TIME_UNIT)
+                    run_u = next_snapshot_u
+                    next_snapshot_u += snapshot_u
+                    self._record_snapshot()
                 
-                # Отправляем обновления в GUI
-                state = self.model.get_system_state()
-                self.state_updated.emit(state)
+                if run_u < target_u:
+                    self.env.run(until=target_u / _TIME_UNIT)
+                    run_u = target_u
+                    if target_u >= duration_u:
+                        # Последний снимок - на момент окончания симуляции
+                        self._record_snapshot()
+                    else:
+                        self.metrics_collector.update_requests(self.model)
+                step_time = perf_counter() - step_start
                 
-                time_series = self.metrics_collector.get_time_series()
-                self.metrics_updated.emit(time_series)
+                # Отправляем обновления в GUI, если предыдущий кадр уже обработан;
+                # пропущенные точки рядов уйдут в следующем кадре
+                if not self._frame_pending.is_set():
+                    self._frame_pending.set()
+                    series_sent = self._emit_frame(series_sent)
                 
-                aggregated = self.metrics_collector.get_aggregated_metrics()
-                self.stats_updated.emit(aggregated)
+                # Подстраиваем шаг под скорость модели и обновляем время следующего обновления
+                if step_time < _FAST_STEP_SEC:
+                    update_interval = min(update_interval * 1.5, _MAX_UPDATE_INTERVAL)
+                elif step_time > _SLOW_STEP_SEC:
+                    update_interval = max(update_interval * 0.7, _MIN_UPDATE_INTERVAL)
+                next_update_u += round(update_interval * _TIME_UNIT)
                 
-                # Обновляем время следующего обновления
-                next_update_time += update_interval
-            
-            # Финальное обновление
-            self.metrics_collector.update_requests(
-                self.model.processed_requests,
-                self.model.rejected_requests
-            )
-            
-            state = self.model.get_system_state()
-            self.state_updated.emit(state)
-            
-            time_series = self.metrics_collector.get_time_series()
-            self.metrics_updated.emit(time_series)
+                if target_u >= duration_u:
+                    break
             
-            aggregated = self.metrics_collector.get_aggregated_metrics()
-            self.stats_updated.emit(aggregated)
+            # Финальное обновление отправляется всегда
+            self.metrics_collector.update_requests(self.model)
+            self._frame_pending.set()
+            self._emit_frame(series_sent)
             
             # Останавливаем процессы
             self.model.is_running = False
             self.autoscaler.is_running = False
             
             self.log_signal.emit("Симуляция завершена", "INFO")
-            processed = len(self.model.processed_requests)
-            rejected = len(self.model.rejected_requests)
+            processed = self.model.processed_count
+            rejected = self.model.rejected_count
             total = processed + rejected
             if total > 0:
                 rejection_rate = (rejected / total) * 100
@@ -221,22 +244,61 @@ class SimulationThread(QThread):
             print("=" * 80)
             # Отправляем полную информацию об ошибке
             self.error_signal.emit(f"{error_msg}\n\nПодробности в консоли.")
+        finally:
+            # Возвращаем объект в поток GUI: тогда deleteLater по finished потока
+            # выполнится в GUI после уже отправленных кадров, и sender() у них
+            # останется действительным
+            app = QCoreApplication.instance()
+            if app is not None:
+                self.moveToThread(app.thread())
+    
+    def _record_snapshot(self):
+        """Обновляет метрики и записывает снимок состояния системы."""
+        self.metrics_collector.update_requests(self.model)
+        current_metrics = self.metrics_collector.get_current_metrics(self.model)
+        self.metrics_collector.record_snapshot(
+            sim_time=current_metrics['sim_time'],
+            queue_length=current_metrics['queue_length'],
+            nodes_count=current_metrics['active_nodes'],
+            avg_response_time=current_metrics['avg_response_time'],
+        )
+    
+    def _emit_frame(self, series_sent: int) -> int:
+        """
+        Отправляет в GUI один кадр обновления.
+        
+        Args:
+            series_sent: Количество снимков, уже отправленных в GUI
+            
+        Returns:
+            Количество отправленных снимков с учетом этого кадра
+        """
+        self.frame_updated.emit({
+            'state': self.model.get_system_state(),
+            'time_series': self.metrics_collector.get_time_series_since(series_sent),
+            'stats': self.metrics_collector.get_aggregated_metrics(),
+        })
+        return self.metrics_collector.snapshot_count
+    
+    def frame_processed(self):
+        """Сообщает, что GUI обработал кадр и готов принять следующий."""
+        self._frame_pending.clear()
     
     def pause(self):
         """Приостанавливает симуляцию."""
+        self._resume_event.clear()
         self.is_paused = True
         if self.model:
-            self.model.is_paused = True
+            self.model.pause()
         if self.autoscaler:
             self.autoscaler.is_paused = True
     
     def resume(self):
         """Возобновляет симуляцию."""
         self.is_paused = False
-        if self.model:
-            self.model.is_paused = False
         if self.autoscaler:
             self.autoscaler.is_paused = False
+        self._resume_event.set()
     
     def stop(self):
         """Останавливает симуляцию."""
@@ -245,4 +307,5 @@ class SimulationThread(QThread):
             self.model.is_running = False
         if self.autoscaler:
             self.autoscaler.is_running = False
+        self._resume_event.set()
 
@@ -13,6 +13,31 @@ from PyQt6.QtCore import Qt
 from typing import Dict, Any
 
 
+_INF = float('inf')
+
+
+def _fmt(value: Any, fmt: str) -> str:
+    """
+    Форматирует числовое значение для таблицы.
+    
+    Args:
+        value: Значение метрики
+        fmt: Строка формата (%-форматирование)
+        
+    Returns:
+        Отформатированное значение или "—" для None, NaN и бесконечности
+    """
+    if value is None:
+        return "—"
+    try:
+        f = float(value)
+    except (ValueError, TypeError, OverflowError):
+        return "—"
+    if f != f or f == _INF or f == -_INF:
+        return "—"
+    return fmt % f
+
+
 class StatsWidget(QWidget):
     """
     Виджет для отображения агрегированных метрик моделирования.
@@ -48,7 +73,9 @@ class StatsWidget(QWidget):
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         self.table.verticalHeader().setVisible(False)
         self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        # Таблица только для чтения: без сортировки и выделения
+        self.table.setSortingEnabled(False)
+        self.table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
         
         # Инициализируем строки таблицы
         self.metrics_labels = [
@@ -66,10 +93,30 @@ class StatsWidget(QWidget):
             "Соответствие SLA (%)",
         ]
         
+        # Ключ метрики, значение по умолчанию и формат для каждой строки
+        self._row_schema = (
+            ('total_requests', 0, '%.0f'),
+            ('processed_requests', 0, '%.0f'),
+            ('rejected_requests', 0, '%.0f'),
+            ('rejected_queue_full', 0, '%.0f'),
+            ('rejected_wait_timeout', 0, '%.0f'),
+            ('rejection_rate', 0.0, '%.2f'),
+            ('avg_response_time', 0.0, '%.3f'),
+            ('max_response_time', 0.0, '%.3f'),
+            ('min_response_time', 0.0, '%.3f'),
+            ('avg_queue_length', 0.0, '%.2f'),
+            ('max_queue_length', 0, '%.0f'),
+            ('sla_compliance_rate', 0.0, '%.2f'),
+        )
+        
         self.table.setRowCount(len(self.metrics_labels))
+        # Ячейки значений сохраняются, чтобы не искать их через table.item()
+        self._value_items = []
         for i, label in enumerate(self.metrics_labels):
             self.table.setItem(i, 0, QTableWidgetItem(label))
-            self.table.setItem(i, 1, QTableWidgetItem("—"))
+            value_item = QTableWidgetItem("—")
+            self.table.setItem(i, 1, value_item)
+            self._value_items.append(value_item)
         
         layout.addWidget(self.table)
         layout.addStretch()
@@ -81,50 +128,17 @@ class StatsWidget(QWidget):
         Args:
             metrics: Словарь с агрегированными метриками
         """
-        # Форматируем значения для отображения
-        def format_value(value, decimals=2):
-            """Форматирует числовое значение."""
-            if value is None:
-                return "—"
-            try:
-                if isinstance(value, float):
-                    import math
-                    if math.isnan(value) or math.isinf(value):
-                        return "—"
-                    return f"{value:.{decimals}f}"
-                float_val = float(value)
-                import math
-                if math.isnan(float_val) or math.isinf(float_val):
-                    return "—"
-                return f"{float_val:.{decimals}f}"
-            except (ValueError, TypeError, OverflowError):
-                return "—"
-        
-        # Обновляем значения в таблице
-        values = [
-            format_value(metrics.get('total_requests', 0), 0),
-            format_value(metrics.get('processed_requests', 0), 0),
-            format_value(metrics.get('rejected_requests', 0), 0),
-            format_value(metrics.get('rejected_queue_full', 0), 0),
-            format_value(metrics.get('rejected_wait_timeout', 0), 0),
-            format_value(metrics.get('rejection_rate', 0.0), 2),
-            format_value(metrics.get('avg_response_time', 0.0), 3),
-            format_value(metrics.get('max_response_time', 0.0), 3),
-            format_value(metrics.get('min_response_time', 0.0), 3),
-            format_value(metrics.get('avg_queue_length', 0.0), 2),
-            format_value(metrics.get('max_queue_length', 0), 0),
-            format_value(metrics.get('sla_compliance_rate', 0.0), 2),
-        ]
-        
-        for i, value in enumerate(values):
-            item = self.table.item(i, 1)
-            if item:
-                item.setText(value)
+        # Таблица перерисовывается один раз после обновления всех строк
+        get = metrics.get
+        self.table.setUpdatesEnabled(False)
+        for item, (key, default, fmt) in zip(self._value_items, self._row_schema):
+            item.setText(_fmt(get(key, default), fmt))
+        self.table.setUpdatesEnabled(True)
     
     def reset(self):
         """Сбрасывает статистику."""
-        for i in range(self.table.rowCount()):
-            item = self.table.item(i, 1)
-            if item:
-                item.setText("—")
+        self.table.setUpdatesEnabled(False)
+        for item in self._value_items:
+            item.setText("—")
+        self.table.setUpdatesEnabled(True)
 
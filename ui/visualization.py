@@ -9,107 +9,182 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGridLayout, QProgressBar, QGroupBox
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QBrush
+from PyQt6.QtCore import Qt, QTimer, QRect, QRectF
+from PyQt6.QtGui import QPainter, QPicture, QColor, QFont, QPen, QBrush, QPalette
+import numpy as np
 import pyqtgraph as pg
-from typing import Dict, Any, List
-from collections import deque
+from typing import Dict, Any, List, Optional
 import os
 
 
+# Интервал объединения обновлений состояния в одну перерисовку (мс)
+_FLUSH_INTERVAL_MS = 33
+
+# Перья кривых мини-графиков по цвету (общие для всех экземпляров панели)
+_CURVE_PENS = {color: pg.mkPen(color=color, width=2) for color in ('r', 'g', 'b', 'y')}
+
+
 class NodeTile(QWidget):
-    """Плитка узла с индикацией состояния и загрузки."""
+    """
+    Плитка узла с индикацией состояния и загрузки.
+    
+    Плитка не содержит дочерних виджетов: рамка, подписи и полоса
+    загрузки рисуются за один проход в paintEvent.
+    """
+    
+    # Цвета плитки: (фон, рамка, текст статуса) для занятого и свободного узла
+    _BUSY_COLORS = (QColor("#fff3cd"), QColor("#ffc107"), QColor("#ff6b6b"))
+    _IDLE_COLORS = (QColor("#d4edda"), QColor("#28a745"), QColor("#4CAF50"))
+    # Цвета полосы загрузки
+    _BAR_RED = QColor("#f44336")
+    _BAR_ORANGE = QColor("#ff9800")
+    _BAR_GREEN = QColor("#4CAF50")
+    _BAR_BORDER = QColor("#333333")
+    # Высота полосы загрузки (пикселей)
+    _BAR_HEIGHT = 15
+    # Записанная отрисовка плиток:
+    # (занят, процент, цвет полосы, ширина, высота) -> QPicture
+    _PICTURE_CACHE: Dict[tuple, QPicture] = {}
+    _PICTURE_CACHE_SIZE = 256
     
     def __init__(self, node_id: int, parent=None):
         super().__init__(parent)
         self.node_id = node_id
         self.is_busy = False
         self.load = 0.0  # Загрузка от 0.0 до 1.0
+        # Загрузка в процентах и цвет полосы, как они отображаются
+        self._percent = 0
+        self._bar_color = self._BAR_GREEN
+        self._title = f"Узел {node_id}"
         self.setMinimumSize(80, 80)
         self.setMaximumSize(120, 120)
-        self.setup_ui()
-    
-    def setup_ui(self):
-        """Создает интерфейс плитки."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(2)
-        
-        # ID узла
-        self.id_label = QLabel(f"Узел {self.node_id}")
-        self.id_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.id_label.setStyleSheet("font-weight: bold; font-size: 10pt;")
-        layout.addWidget(self.id_label)
-        
-        # Индикатор состояния
-        self.status_label = QLabel("IDLE")
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("font-size: 9pt;")
-        layout.addWidget(self.status_label)
-        
-        # Прогресс-бар загрузки
-        self.load_bar = QProgressBar()
-        self.load_bar.setRange(0, 100)
-        self.load_bar.setValue(0)
-        self.load_bar.setTextVisible(True)
-        self.load_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #333;
-                border-radius: 3px;
-                text-align: center;
-                height: 15px;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 2px;
-            }
-        """)
-        layout.addWidget(self.load_bar)
+        
+        # Шрифты подписей
+        self._id_font = QFont(self.font())
+        self._id_font.setPointSize(10)
+        self._id_font.setBold(True)
+        self._status_font = QFont(self.font())
+        self._status_font.setPointSize(9)
+        self._status_busy_font = QFont(self._status_font)
+        self._status_busy_font.setBold(True)
+        self._bar_font = QFont(self.font())
+        self._bar_font.setPointSize(8)
     
     def update_state(self, is_busy: bool, load: float):
         """
         Обновляет состояние узла.
         
+        Плитка перерисовывается, только если изменилось отображаемое
+        состояние (статус или процент загрузки).
+        
         Args:
             is_busy: Узел занят обработкой
             load: Загрузка узла (0.0 - 1.0)
         """
-        self.is_busy = is_busy
-        self.load = load
-        
-        # Обновляем статус
-        if is_busy:
-            self.status_label.setText("BUSY")
-            self.status_label.setStyleSheet("font-size: 9pt; color: #ff6b6b; font-weight: bold;")
-            self.setStyleSheet("background-color: #fff3cd; border: 2px solid #ffc107; border-radius: 5px;")
-        else:
-            self.status_label.setText("IDLE")
-            self.status_label.setStyleSheet("font-size: 9pt; color: #4CAF50;")
-            self.setStyleSheet("background-color: #d4edda; border: 2px solid #28a745; border-radius: 5px;")
+        percent = int(load * 100)
         
-        # Обновляем прогресс-бар
-        self.load_bar.setValue(int(load * 100))
-        
-        # Меняем цвет прогресс-бара в зависимости от загрузки
+        # Цвет полосы зависит от загрузки
         if load > 0.8:
-            color = "#f44336"  # Красный
+            bar_color = self._BAR_RED
         elif load > 0.5:
-            color = "#ff9800"  # Оранжевый
+            bar_color = self._BAR_ORANGE
         else:
-            color = "#4CAF50"  # Зеленый
+            bar_color = self._BAR_GREEN
         
-        self.load_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid #333;
-                border-radius: 3px;
-                text-align: center;
-                height: 15px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 2px;
-            }}
-        """)
+        changed = (
+            is_busy != self.is_busy
+            or percent != self._percent
+            or bar_color is not self._bar_color
+        )
+        self.is_busy = is_busy
+        self.load = load
+        self._percent = percent
+        self._bar_color = bar_color
+        if changed:
+            self.update()
+    
+    def _layout_rects(self) -> tuple:
+        """
+        Вычисляет области подписей и полосы загрузки.
+        
+        Returns:
+            (id_rect, status_rect, bar_rect)
+        """
+        inner = self.rect().adjusted(5, 5, -5, -5)
+        bar_height = self._BAR_HEIGHT
+        text_height = (inner.height() - bar_height) // 2
+        id_rect = QRect(inner.left(), inner.top(), inner.width(), text_height)
+        status_rect = QRect(inner.left(), inner.top() + text_height, inner.width(), text_height)
+        bar_rect = QRect(inner.left(), inner.bottom() - bar_height + 1, inner.width(), bar_height)
+        return id_rect, status_rect, bar_rect
+    
+    def _render_picture(self) -> QPicture:
+        """
+        Записывает отрисовку плитки без номера узла.
+        
+        Returns:
+            QPicture с рамкой, статусом и полосой загрузки
+        """
+        picture = QPicture()
+        painter = QPainter(picture)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Фон и рамка
+        background, border, status_color = (
+            self._BUSY_COLORS if self.is_busy else self._IDLE_COLORS
+        )
+        painter.setPen(QPen(border, 2))
+        painter.setBrush(QBrush(background))
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(1, 1, -1, -1), 5, 5)
+        
+        _, status_rect, bar_rect = self._layout_rects()
+        
+        # Статус
+        painter.setPen(status_color)
+        if self.is_busy:
+            painter.setFont(self._status_busy_font)
+            painter.drawText(status_rect, Qt.AlignmentFlag.AlignCenter, "BUSY")
+        else:
+            painter.setFont(self._status_font)
+            painter.drawText(status_rect, Qt.AlignmentFlag.AlignCenter, "IDLE")
+        
+        # Полоса загрузки: рамка, заполненная часть и процент
+        painter.setPen(QPen(self._BAR_BORDER, 1))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(QRectF(bar_rect).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+        chunk = bar_rect.adjusted(2, 2, -2, -2)
+        chunk.setWidth(chunk.width() * min(100, max(0, self._percent)) // 100)
+        if chunk.width() > 0:
+            painter.fillRect(chunk, self._bar_color)
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        painter.setFont(self._bar_font)
+        painter.drawText(bar_rect, Qt.AlignmentFlag.AlignCenter, f"{self._percent}%")
+        painter.end()
+        return picture
+    
+    def paintEvent(self, event):
+        """Рисует плитку: рамку, номер узла, статус и полосу загрузки."""
+        # Плитки с одинаковым состоянием и размером отличаются только
+        # номером узла, поэтому остальная отрисовка берется из общего кеша
+        cache = NodeTile._PICTURE_CACHE
+        key = (self.is_busy, self._percent, self._bar_color.rgb(), self.width(), self.height())
+        picture = cache.get(key)
+        if picture is None:
+            if len(cache) >= self._PICTURE_CACHE_SIZE:
+                cache.clear()
+            picture = self._render_picture()
+            cache[key] = picture
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPicture(0, 0, picture)
+        
+        # Номер узла
+        id_rect, _, _ = self._layout_rects()
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        painter.setFont(self._id_font)
+        painter.drawText(id_rect, Qt.AlignmentFlag.AlignCenter, self._title)
+        painter.end()
 
 
 class SystemVisualization(QWidget):
@@ -122,6 +197,9 @@ class SystemVisualization(QWidget):
     - Мини-графики метрик
     """
     
+    # Шаг прокрутки мини-графиков по оси X (точек)
+    _X_RANGE_STEP = 10
+    
     def __init__(self):
         """Инициализирует виджет визуализации."""
         super().__init__()
@@ -137,17 +215,42 @@ class SystemVisualization(QWidget):
             'rejected_requests': 0,
         }
         
-        # Данные для мини-графиков (последние 100 точек)
+        # Данные для мини-графиков (последние 100 точек): кольцевые буферы
+        # с индексом записи и числом заполненных элементов
         self.max_history = 100
-        self.queue_history = deque(maxlen=self.max_history)
-        self.response_time_history = deque(maxlen=self.max_history)
-        self.sla_history = deque(maxlen=self.max_history)
-        self.nodes_history = deque(maxlen=self.max_history)
-        self.time_history = deque(maxlen=self.max_history)
+        self.queue_history = np.zeros(self.max_history, dtype=np.float32)
+        self.response_time_history = np.zeros(self.max_history, dtype=np.float32)
+        self.sla_history = np.zeros(self.max_history, dtype=np.float32)
+        self.nodes_history = np.zeros(self.max_history, dtype=np.float32)
+        self._hist_idx = 0
+        self._hist_len = 0
+        # Смещения точек окна по оси X (ось X строится от time_counter)
+        self._x_offsets = np.arange(self.max_history, dtype=np.float32)
         self.time_counter = 0
-        
-        # Узлы
+        # Правая граница текущего диапазона мини-графиков по оси X
+        self._x_range_max = 0
+        
+        # Последние выведенные значения: текст меток меняется только
+        # при изменении значения
+        self._last_queue = None
+        self._last_processed = None
+        self._last_rejected = None
+        self._last_avg_rt = None
+        self._last_sla = None
+        
+        # Узлы: node_tiles - отображаемые плитки, _tile_pool - все созданные
+        # (лишние скрываются и переиспользуются при росте числа узлов)
         self.node_tiles: List[NodeTile] = []
+        self._tile_pool: List[NodeTile] = []
+        self._grid_cols = 0
+        
+        # Последнее полученное состояние, ожидающее отрисовки: промежуточные
+        # состояния между срабатываниями таймера отбрасываются
+        self._pending_state: Optional[Dict[str, Any]] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
     
     def setup_ui(self):
         """Создает интерфейс визуализации."""
@@ -246,7 +349,7 @@ class SystemVisualization(QWidget):
         self.queue_plot.showGrid(x=True, y=True, alpha=0.3)
         self.queue_plot.setFixedHeight(120)
         self.queue_plot.setYRange(0, 50, padding=0)
-        self.queue_curve = self.queue_plot.plot(pen=pg.mkPen(color='r', width=2))
+        self.queue_curve = self.queue_plot.plot(pen=_CURVE_PENS['r'])
         right_panel.addWidget(self.queue_plot)
         
         # Мини-график: Время отклика
@@ -256,7 +359,7 @@ class SystemVisualization(QWidget):
         self.response_plot.showGrid(x=True, y=True, alpha=0.3)
         self.response_plot.setFixedHeight(120)
         self.response_plot.setYRange(0, 10, padding=0)
-        self.response_curve = self.response_plot.plot(pen=pg.mkPen(color='g', width=2))
+        self.response_curve = self.response_plot.plot(pen=_CURVE_PENS['g'])
         right_panel.addWidget(self.response_plot)
         
         # Мини-график: SLA%
@@ -266,7 +369,7 @@ class SystemVisualization(QWidget):
         self.sla_plot.showGrid(x=True, y=True, alpha=0.3)
         self.sla_plot.setFixedHeight(120)
         self.sla_plot.setYRange(0, 100, padding=0)
-        self.sla_curve = self.sla_plot.plot(pen=pg.mkPen(color='b', width=2))
+        self.sla_curve = self.sla_plot.plot(pen=_CURVE_PENS['b'])
         right_panel.addWidget(self.sla_plot)
         
         # Мини-график: Количество узлов
@@ -276,11 +379,28 @@ class SystemVisualization(QWidget):
         self.nodes_plot.showGrid(x=True, y=True, alpha=0.3)
         self.nodes_plot.setFixedHeight(120)
         self.nodes_plot.setYRange(0, 15, padding=0)
-        self.nodes_curve = self.nodes_plot.plot(pen=pg.mkPen(color='y', width=2))
+        self.nodes_curve = self.nodes_plot.plot(pen=_CURVE_PENS['y'])
         right_panel.addWidget(self.nodes_plot)
         
         main_layout.addLayout(right_panel, stretch=1)
         
+        # Все мини-графики (общая прокрутка по оси X)
+        self._plots = (self.queue_plot, self.response_plot, self.sla_plot, self.nodes_plot)
+        # Графики для сохранения: (виджет, имя файла, заголовок)
+        self._savable_plots = (
+            (self.queue_plot, "queue_length", "Длина очереди"),
+            (self.response_plot, "response_time", "Среднее время отклика"),
+            (self.sla_plot, "sla_compliance", "SLA соответствие"),
+            (self.nodes_plot, "active_nodes", "Активные узлы"),
+        )
+        
+        # Настройки отрисовки: без сглаживания, только видимая часть,
+        # прореживание точек при нехватке пикселей
+        for plot in self._plots:
+            plot.setAntialiasing(False)
+            plot.setClipToView(True)
+            plot.setDownsampling(auto=True, mode='peak')
+        
         layout.addLayout(main_layout)
         
         # Кнопка сохранения
@@ -298,47 +418,76 @@ class SystemVisualization(QWidget):
         Args:
             total_nodes: Общее количество узлов
         """
-        # Очищаем старые плитки
-        for tile in self.node_tiles:
-            tile.deleteLater()
-        self.node_tiles.clear()
+        pool = self._tile_pool
         
         # Вычисляем оптимальное количество колонок (примерно 4-5)
         cols = min(5, max(2, int((total_nodes + 1) ** 0.5) + 1))
         
-        # Создаем новые плитки
-        for i in range(total_nodes):
+        # При смене числа колонок переставляем уже созданные плитки
+        if cols != self._grid_cols:
+            self._grid_cols = cols
+            for i, tile in enumerate(pool):
+                self.nodes_grid.removeWidget(tile)
+                self.nodes_grid.addWidget(tile, i // cols, i % cols)
+        
+        # Создаем недостающие плитки
+        for i in range(len(pool), total_nodes):
             tile = NodeTile(i)
-            row = i // cols
-            col = i % cols
-            self.nodes_grid.addWidget(tile, row, col)
-            self.node_tiles.append(tile)
+            self.nodes_grid.addWidget(tile, i // cols, i % cols)
+            pool.append(tile)
+        
+        # Показываем нужное количество плиток, остальные скрываем
+        for i, tile in enumerate(pool):
+            tile.setVisible(i < total_nodes)
+        self.node_tiles = pool[:total_nodes]
     
-    def _get_node_load(self, node_id: int, state: dict) -> tuple:
+    def _get_node_load(self, state: dict) -> float:
         """
-        Вычисляет загрузку узла.
+        Вычисляет загрузку активного узла.
+        
+        Загрузка одинакова для всех активных узлов, поэтому вычисляется
+        один раз на обновление.
         
         Args:
-            node_id: ID узла
             state: Состояние системы
             
         Returns:
-            (is_busy, load) где load от 0.0 до 1.0
+            Загрузка от 0.0 до 1.0
         """
-        # Упрощенная логика: если узел существует и активен, считаем загрузку
+        # Упрощенная логика: примерная загрузка на основе длины очереди
         # В реальности нужно получать данные из модели
         active_nodes = state.get('active_nodes', 0)
-        if node_id < active_nodes:
-            # Примерная загрузка на основе длины очереди
-            queue_len = state.get('queue_length', 0)
-            avg_load = min(1.0, queue_len / max(1, active_nodes * 2))
-            return (True, avg_load)
-        return (False, 0.0)
+        queue_len = state.get('queue_length', 0)
+        return min(1.0, queue_len / max(1, active_nodes * 2))
+    
+    def _history_view(self, history: np.ndarray) -> np.ndarray:
+        """
+        Возвращает историю метрики в хронологическом порядке.
+        
+        Пока буфер не заполнен, возвращается срез без копирования;
+        после заполнения буфер склеивается начиная с самой старой точки.
+        
+        Args:
+            history: Кольцевой буфер метрики
+            
+        Returns:
+            Непрерывный массив значений от старых к новым
+        """
+        if self._hist_len < self.max_history:
+            return history[:self._hist_len]
+        idx = self._hist_idx
+        if idx == 0:
+            return history
+        return np.concatenate((history[idx:], history[:idx]))
     
     def update_state(self, state: Dict[str, Any]):
         """
         Обновляет состояние визуализации.
         
+        Состояние и точка истории мини-графиков записываются сразу,
+        а виджеты перерисовываются по таймеру не чаще одного раза
+        за интервал, независимо от частоты обновлений модели.
+        
         Args:
             state: Словарь с текущим состоянием системы
         """
@@ -355,82 +504,116 @@ class SystemVisualization(QWidget):
             'rejected_count': state.get('rejected_count', 0),
         })
         
+        # Добавляем точку в историю мини-графиков
+        self.time_counter += 1
+        idx = self._hist_idx
+        self.queue_history[idx] = self.current_state['queue_length']
+        self.response_time_history[idx] = self.current_state['avg_response_time']
+        self.sla_history[idx] = self.current_state['sla_compliance_rate']
+        self.nodes_history[idx] = self.current_state['active_nodes']
+        self._hist_idx = (idx + 1) % self.max_history
+        if self._hist_len < self.max_history:
+            self._hist_len += 1
+        
+        self._pending_state = state
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush(self):
+        """Отрисовывает последнее полученное состояние системы."""
+        state = self._pending_state
+        if state is None:
+            return
+        self._pending_state = None
+        current = self.current_state
+        
         # Обновляем очередь
-        queue_len = self.current_state['queue_length']
-        queue_capacity = self.current_state['queue_capacity']
-        queue_percent = min(100, int((queue_len / max(1, queue_capacity)) * 100))
+        queue_len = current['queue_length']
+        queue_capacity = current['queue_capacity']
         
-        self.queue_label.setText(f"Очередь: {queue_len} / {queue_capacity}")
-        self.queue_bar.setMaximum(queue_capacity)
-        self.queue_bar.setValue(queue_len)
-        self.queue_bar.setFormat(f"{queue_len} / {queue_capacity}")
+        if (queue_len, queue_capacity) != self._last_queue:
+            self._last_queue = (queue_len, queue_capacity)
+            self.queue_label.setText(f"Очередь: {queue_len} / {queue_capacity}")
+            self.queue_bar.setMaximum(queue_capacity)
+            self.queue_bar.setValue(queue_len)
+            self.queue_bar.setFormat(f"{queue_len} / {queue_capacity}")
         
         # Обновляем сетку узлов
-        total_nodes = self.current_state['total_nodes']
+        total_nodes = current['total_nodes']
         if len(self.node_tiles) != total_nodes:
             self._update_nodes_grid(total_nodes)
         
-        # Обновляем состояние каждого узла
+        # Обновляем состояние каждого узла: первые active_nodes узлов заняты
+        active_nodes = current['active_nodes']
+        load = self._get_node_load(state)
         for i, tile in enumerate(self.node_tiles):
-            is_busy, load = self._get_node_load(i, state)
-            tile.update_state(is_busy, load)
+            if i < active_nodes:
+                tile.update_state(True, load)
+            else:
+                tile.update_state(False, 0.0)
         
         # Обновляем статистику
-        self.processed_label.setText(f"Обработано: {state.get('processed_count', 0)}")
-        self.rejected_label.setText(f"Отклонено: {state.get('rejected_count', 0)}")
-        
-        # Обновляем мини-графики
-        self.time_counter += 1
-        self.time_history.append(self.time_counter)
-        self.queue_history.append(queue_len)
-        
-        # Получаем метрики из временных рядов, если доступны
-        if 'avg_response_time' in state:
-            self.current_state['avg_response_time'] = state['avg_response_time']
-            self.response_time_history.append(state['avg_response_time'])
-        else:
-            self.response_time_history.append(0.0)
+        processed = current['processed_count']
+        if processed != self._last_processed:
+            self._last_processed = processed
+            self.processed_label.setText(f"Обработано: {processed}")
+        rejected = current['rejected_count']
+        if rejected != self._last_rejected:
+            self._last_rejected = rejected
+            self.rejected_label.setText(f"Отклонено: {rejected}")
         
-        if 'sla_compliance_rate' in state:
-            self.current_state['sla_compliance_rate'] = state['sla_compliance_rate']
-            self.sla_history.append(state['sla_compliance_rate'])
-        else:
-            self.sla_history.append(0.0)
-        
-        self.nodes_history.append(self.current_state['active_nodes'])
-        
-        # Обновляем графики
-        if len(self.time_history) > 1:
-            time_list = list(self.time_history)
-            self.queue_curve.setData(time_list, list(self.queue_history))
-            self.response_curve.setData(time_list, list(self.response_time_history))
-            self.sla_curve.setData(time_list, list(self.sla_history))
-            self.nodes_curve.setData(time_list, list(self.nodes_history))
-            
-            # Автомасштабирование по X
-            x_min = max(0, self.time_counter - self.max_history)
-            x_max = self.time_counter
-            
-            # Используем сохраненные PlotWidget
-            if hasattr(self, 'queue_plot'):
-                self.queue_plot.setXRange(x_min, x_max, padding=0)
-            if hasattr(self, 'response_plot'):
-                self.response_plot.setXRange(x_min, x_max, padding=0)
-            if hasattr(self, 'sla_plot'):
-                self.sla_plot.setXRange(x_min, x_max, padding=0)
-            if hasattr(self, 'nodes_plot'):
-                self.nodes_plot.setXRange(x_min, x_max, padding=0)
+        self._redraw_plots()
         
         # Обновляем метки
-        avg_rt = self.current_state.get('avg_response_time', 0.0)
-        self.avg_response_label.setText(f"Ср. время отклика: {avg_rt:.2f}")
+        avg_rt = current['avg_response_time']
+        if avg_rt != self._last_avg_rt:
+            self._last_avg_rt = avg_rt
+            self.avg_response_label.setText(f"Ср. время отклика: {avg_rt:.2f}")
+        
+        sla = current['sla_compliance_rate']
+        if sla != self._last_sla:
+            self._last_sla = sla
+            self.sla_label.setText(f"SLA: {sla:.1f}%")
+    
+    def _redraw_plots(self):
+        """
+        Передает накопленную историю в мини-графики.
         
-        sla = self.current_state.get('sla_compliance_rate', 0.0)
-        self.sla_label.setText(f"SLA: {sla:.1f}%")
+        История не содержит NaN, поэтому проверка конечности значений
+        пропускается, а точки соединяются без разрывов.
+        """
+        if self._hist_len <= 1:
+            return
+        count = self._hist_len
+        x = self._x_offsets[:count] + np.float32(self.time_counter - count + 1)
+        self.queue_curve.setData(
+            x, self._history_view(self.queue_history), connect='all', skipFiniteCheck=True
+        )
+        self.response_curve.setData(
+            x, self._history_view(self.response_time_history), connect='all', skipFiniteCheck=True
+        )
+        self.sla_curve.setData(
+            x, self._history_view(self.sla_history), connect='all', skipFiniteCheck=True
+        )
+        self.nodes_curve.setData(
+            x, self._history_view(self.nodes_history), connect='all', skipFiniteCheck=True
+        )
+        
+        # Прокрутка по X шагами по _X_RANGE_STEP точек: диапазон меняется
+        # только когда новая точка выходит за правую границу окна; окно
+        # расширено на шаг, чтобы вся история оставалась видимой
+        if self.time_counter > self._x_range_max:
+            step = self._X_RANGE_STEP
+            x_max = -(-self.time_counter // step) * step
+            x_min = max(0, x_max - self.max_history - step)
+            self._x_range_max = x_max
+            for plot in self._plots:
+                plot.setXRange(x_min, x_max, padding=0)
     
     def save_graphs(self):
         """Сохраняет графики в PNG файлы."""
-        from PyQt6.QtWidgets import QFileDialog
+        from PyQt6.QtWidgets import QFileDialog, QMessageBox
+        from pyqtgraph.exporters import ImageExporter
         from datetime import datetime
         
         # Выбираем директорию для сохранения
@@ -439,46 +622,25 @@ class SystemVisualization(QWidget):
             return
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        saved = 0
         
         # Сохраняем каждый график
-        plots = [
-            (self.queue_curve, "queue_length", "Длина очереди"),
-            (self.response_curve, "response_time", "Среднее время отклика"),
-            (self.sla_curve, "sla_compliance", "SLA соответствие"),
-            (self.nodes_curve, "active_nodes", "Активные узлы"),
-        ]
-        
-        saved_files = []
-        
-        # Используем сохраненные PlotWidget
-        plots_to_save = []
-        if hasattr(self, 'queue_plot'):
-            plots_to_save.append((self.queue_plot, "queue_length", "Длина очереди"))
-        if hasattr(self, 'response_plot'):
-            plots_to_save.append((self.response_plot, "response_time", "Среднее время отклика"))
-        if hasattr(self, 'sla_plot'):
-            plots_to_save.append((self.sla_plot, "sla_compliance", "SLA соответствие"))
-        if hasattr(self, 'nodes_plot'):
-            plots_to_save.append((self.nodes_plot, "active_nodes", "Активные узлы"))
-        
-        for plot_widget, name, title in plots_to_save:
+        for plot_widget, name, title in self._savable_plots:
             try:
                 filename = os.path.join(directory, f"{name}_{timestamp}.png")
-                exporter = pg.exporters.ImageExporter(plot_widget)
+                exporter = ImageExporter(plot_widget.getPlotItem())
                 exporter.export(filename)
-                saved_files.append(filename)
+                saved += 1
             except Exception as e:
                 print(f"Ошибка при сохранении {name}: {e}")
         
-        if saved_files:
-            from PyQt6.QtWidgets import QMessageBox
+        if saved:
             QMessageBox.information(
                 self,
                 "Графики сохранены",
-                f"Сохранено {len(saved_files)} графиков в:\n{directory}"
+                f"Сохранено {saved} графиков в:\n{directory}"
             )
         else:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self,
                 "Ошибка",
@@ -5,14 +5,19 @@
 Создает простую иконку облачка для приложения.
 """
 
+from functools import lru_cache
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QBrush, QPen
 from PyQt6.QtCore import Qt, QSize
 
 
+@lru_cache(maxsize=8)
 def create_cloud_icon(size=64):
     """
     Создает иконку облачка.
     
+    Иконка рисуется один раз для каждого размера, повторные вызовы
+    возвращают закешированный QIcon.
+    
     Args:
         size: Размер иконки в пикселях
         
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Проверка доступности OpenGL для отрисовки графиков.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def opengl_available() -> bool:
+    """
+    Проверяет, можно ли отрисовывать графики через OpenGL.
+    
+    Требуются модуль QtOpenGLWidgets и платформа Qt, создающая контекст
+    OpenGL; иначе графики рисуются растровым путем. Проверка выполняется
+    один раз за процесс (после создания QApplication).
+    
+    Returns:
+        True, если контекст OpenGL успешно создан
+    """
+    try:
+        from PyQt6 import QtOpenGLWidgets  # noqa: F401
+        from PyQt6.QtGui import QOpenGLContext
+    except ImportError:
+        return False
+    return QOpenGLContext().create()
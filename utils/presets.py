@@ -5,7 +5,8 @@
 Содержит предустановленные конфигурации для различных сценариев моделирования.
 """
 
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple
 
 
 class Preset:
@@ -23,10 +24,12 @@ class Preset:
         self.name = name
         self.description = description
         self.parameters = parameters
+        # Представление только для чтения: отдается без копирования
+        self._params_view = MappingProxyType(parameters)
     
-    def get_parameters(self) -> Dict[str, Any]:
-        """Возвращает параметры пресета."""
-        return self.parameters.copy()
+    def get_parameters(self) -> Mapping[str, Any]:
+        """Возвращает параметры пресета (только для чтения)."""
+        return self._params_view
 
 
 # Определение пресетов
@@ -198,6 +201,12 @@ PRESETS: List[Preset] = [
 ]
 
 
+# Неизменяемый список пресетов для get_all_presets
+_ALL_PRESETS: Tuple[Preset, ...] = tuple(PRESETS)
+# Пресеты по названию для get_preset_by_name
+_PRESETS_BY_NAME: Dict[str, Preset] = {preset.name: preset for preset in PRESETS}
+
+
 def get_preset_by_name(name: str) -> Preset:
     """
     Получает пресет по имени.
@@ -208,13 +217,10 @@ def get_preset_by_name(name: str) -> Preset:
     Returns:
         Preset объект или None, если не найден
     """
-    for preset in PRESETS:
-        if preset.name == name:
-            return preset
-    return None
+    return _PRESETS_BY_NAME.get(name)
 
 
-def get_all_presets() -> List[Preset]:
-    """Возвращает список всех пресетов."""
-    return PRESETS.copy()
+def get_all_presets() -> Tuple[Preset, ...]:
+    """Возвращает все пресеты в виде кортежа."""
+    return _ALL_PRESETS
 